@@ -8,15 +8,286 @@
 """
 
 try:
-    from typing import Optional, Union, List, Tuple
+    from typing import Optional, Union, List, Tuple, Iterable, Iterator
     from fontio import BuiltinFont
     from adafruit_bitmap_font.bdf import BDF
     from adafruit_bitmap_font.pcf import PCF
 except ImportError:
     pass
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict  # eviction order is arbitrary then, the cache still works
 from displayio import Group, Palette
 
 
+class GlyphCache:
+    """Caches the glyph lookups of a font, shared by every label using the font.
+    Get the cache of a font with `glyph_cache`.
+
+    ASCII code points are held in a dense list indexed by code point. Other
+    code points go into a dictionary that evicts the least recently used glyph
+    once ``max_glyphs`` are held, or once their bitmaps take more than
+    ``budget`` bytes. When a ``budget`` is set, glyphs evicted from the cache
+    are dropped from the glyphs a BDF or PCF font keeps loaded too, so the
+    memory of the glyphs of a large font stays bounded. Without one the font
+    keeps its glyphs and evicted glyphs are looked up again without reloading.
+
+    ``hits``, ``misses`` and ``evictions`` count the lookups answered by the
+    cache, the lookups that went to the font and the glyphs evicted.
+
+    :param font: The font to look glyphs up in
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param int max_glyphs: Number of non ASCII glyphs to keep
+    :param int budget: Bytes of bitmaps of the non ASCII glyphs to keep, `None`
+     for no limit
+    """
+
+    def __init__(
+        self,
+        font: Union[BuiltinFont, BDF, PCF],
+        max_glyphs: int = 64,
+        budget: Optional[int] = None,
+    ) -> None:
+        self._font = font
+        self._ascii = [None] * 128
+        self._others = OrderedDict()
+        self._max_glyphs = max_glyphs
+        self._budget = budget
+        self._used = 0
+        self._monospace = None
+        self._monospace_checked = False
+        self._bounding_box = None
+        self._ascent_descent = None
+        self._space_width = None
+        self._hyphen_width = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def font(self) -> Union[BuiltinFont, BDF, PCF]:
+        """The font the glyphs come from."""
+        return self._font
+
+    @property
+    def budget(self) -> Optional[int]:
+        """Bytes of bitmaps of the non ASCII glyphs to keep, `None` for no limit.
+        Lowering it evicts glyphs right away."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, new_budget: Optional[int]) -> None:
+        self._budget = new_budget
+        self._evict()
+
+    @property
+    def used(self) -> int:
+        """Approximate bytes taken by the bitmaps of the non ASCII glyphs held"""
+        return self._used
+
+    @property
+    def bounding_box(self) -> Tuple[int, ...]:
+        """The font's ``get_bounding_box()``, asked for once."""
+        if self._bounding_box is None:
+            self._bounding_box = self._font.get_bounding_box()
+        return self._bounding_box
+
+    @property
+    def ascent_descent(self) -> Tuple[int, int]:
+        """Ascent and descent of the font, worked out once for all the labels.
+        Fonts without ``ascent`` and ``descent`` attributes are measured with
+        the glyphs of a few characters."""
+        if self._ascent_descent is None:
+            font = self._font
+            if hasattr(font, "ascent") and hasattr(font, "descent"):
+                self._ascent_descent = font.ascent, font.descent
+            else:
+                # check a few glyphs for maximum ascender and descender height
+                glyphs = "M j'"  # choose glyphs with highest ascender and lowest
+                # descender, will depend upon font used
+                self.load_glyphs(glyphs)
+                ascender_max = descender_max = 0
+                for char in glyphs:
+                    this_glyph = self.get_glyph(ord(char))
+                    if this_glyph:
+                        ascender_max = max(
+                            ascender_max, this_glyph.height + this_glyph.dy
+                        )
+                        descender_max = max(descender_max, -this_glyph.dy)
+                self._ascent_descent = ascender_max, descender_max
+        return self._ascent_descent
+
+    @property
+    def space_width(self) -> int:
+        """Advance of a space"""
+        if self._space_width is None:
+            self._space_width = self.get_glyph(ord(" ")).shift_x
+        return self._space_width
+
+    @property
+    def hyphen_width(self) -> int:
+        """Advance of a hyphen"""
+        if self._hyphen_width is None:
+            self._hyphen_width = self.get_glyph(ord("-")).shift_x
+        return self._hyphen_width
+
+    @property
+    def monospace(self):
+        """A glyph with the metrics shared by every glyph of a fixed width font
+        like ``terminalio.FONT``, `None` for other fonts. Labels lay out the text
+        of such fonts arithmetically from line lengths and this cell.
+
+        Only fonts with all their glyphs in one ``bitmap``, like a
+        `fontio.BuiltinFont`, qualify as their glyphs all have the same tile
+        size. A font with a ``monospace`` attribute, like a `FontAtlas`, says
+        itself whether its advances are all the same. The metrics of a few
+        glyphs are compared to make sure."""
+        if not self._monospace_checked:
+            self._monospace_checked = True
+            if hasattr(self._font, "bitmap") and getattr(self._font, "monospace", True):
+                cell = None
+                sampled = 0
+                for char in "M i.":
+                    glyph = self.get_glyph(ord(char))
+                    if glyph is None:
+                        continue
+                    sampled += 1
+                    metrics = (
+                        glyph.width,
+                        glyph.height,
+                        glyph.dx,
+                        glyph.dy,
+                        glyph.shift_x,
+                    )
+                    if cell is None:
+                        cell, cell_metrics = glyph, metrics
+                    elif metrics != cell_metrics:
+                        cell = None
+                        break
+                if cell is not None and sampled > 1 and cell.shift_x > 0:
+                    self._monospace = cell
+        return self._monospace
+
+    def _size(self, glyph) -> int:
+        # Bytes of the glyph's own bitmap, rows padded to 32 bits like displayio
+        # does. Glyphs sharing the bitmap of the font cost nothing extra.
+        if hasattr(self._font, "bitmap"):
+            return 0
+        return (glyph.width + 31) // 32 * 4 * glyph.height
+
+    def _largest_size(self) -> int:
+        # Bytes of a glyph as large as the bounding box
+        if hasattr(self._font, "bitmap"):
+            return 0
+        width, height = self.bounding_box[:2]
+        return (width + 31) // 32 * 4 * height
+
+    def _batch_size(self) -> int:
+        # Glyphs loaded with one load_glyphs call, as many as the cache holds
+        size = self._max_glyphs
+        largest = self._largest_size()
+        if self._budget is not None and largest:
+            size = min(size, self._budget // largest)
+        return max(1, size)
+
+    def _evict(self, room: int = 0) -> None:
+        # Evict until room more glyphs of the size of the bounding box fit, or
+        # with no room asked for, until the cache is within its limits again
+        # without evicting the glyph just added
+        others = self._others
+        budget = self._budget
+        # pylint: disable=protected-access
+        font_glyphs = None
+        if budget is not None and not hasattr(self._font, "bitmap"):
+            font_glyphs = getattr(self._font, "_glyphs", None)
+        room_bytes = room * self._largest_size() if budget is not None else 0
+        while len(others) > (0 if room else 1) and (
+            len(others) + room > self._max_glyphs
+            or (budget is not None and self._used + room_bytes > budget)
+        ):
+            codepoint = next(iter(others))  # least recently used
+            self._used -= self._size(others.pop(codepoint))
+            self.evictions += 1
+            if font_glyphs is not None:
+                font_glyphs.pop(codepoint, None)
+
+    def get_glyph(self, codepoint: int):
+        """Same as the font's ``get_glyph``, `None` if the font has no such glyph."""
+        if codepoint < 128:
+            glyph = self._ascii[codepoint]
+            if glyph is None:
+                self.misses += 1
+                glyph = self._font.get_glyph(codepoint)
+                self._ascii[codepoint] = glyph
+            else:
+                self.hits += 1
+            return glyph
+
+        others = self._others
+        glyph = others.pop(codepoint, None)
+        if glyph is not None:
+            self.hits += 1
+            others[codepoint] = glyph  # reinsert as the most recently used
+            return glyph
+
+        self.misses += 1
+        glyph = self._font.get_glyph(codepoint)
+        if glyph is None:
+            return None
+        others[codepoint] = glyph
+        self._used += self._size(glyph)
+        self._evict()
+        return glyph
+
+    def load_glyphs(self, text: str) -> None:
+        """Load the glyphs of ``text`` the cache doesn't hold with one
+        ``load_glyphs`` call to the font per batch, instead of one file search
+        per glyph. A batch is no larger than what the cache holds under
+        ``max_glyphs`` and ``budget``, and room for it is evicted before it is
+        loaded, so text with many different glyphs doesn't load them all at
+        once."""
+        load_glyphs = getattr(self._font, "load_glyphs", None)
+        if load_glyphs is None:
+            return  # Builtin font doesn't have or need load_glyphs
+        # Glyphs the font still holds need no loading either
+        loaded = getattr(self._font, "_glyphs", {})  # pylint: disable=protected-access
+        missing = []
+        seen = set()
+        for char in text:
+            codepoint = ord(char)
+            if codepoint in seen:
+                continue
+            seen.add(codepoint)
+            if codepoint < 128:
+                if self._ascii[codepoint] is None and codepoint not in loaded:
+                    missing.append(codepoint)
+            elif codepoint not in self._others and codepoint not in loaded:
+                missing.append(codepoint)
+        batch_size = self._batch_size()
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            self._evict(sum(1 for codepoint in batch if codepoint >= 128))
+            load_glyphs(batch)
+            for codepoint in batch:
+                self.get_glyph(codepoint)
+
+
+_glyph_caches = {}
+
+
+def glyph_cache(font: Union[BuiltinFont, BDF, PCF]) -> GlyphCache:
+    """The `GlyphCache` of ``font``, created on first use.
+
+    :param font: The font to get the cache for
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    """
+    cache = _glyph_caches.get(font)
+    if cache is None:
+        cache = _glyph_caches[font] = GlyphCache(font)
+    return cache
+
+
 def wrap_text_to_pixels(
     string: str,
     max_width: int,
@@ -24,8 +295,6 @@ def wrap_text_to_pixels(
     indent0: str = "",
     indent1: str = "",
 ) -> List[str]:
-    # pylint: disable=too-many-branches, too-many-locals
-
     """wrap_text_to_pixels function
     A helper that will return a list of lines with word-break wrapping.
     Leading and trailing whitespace in your string will be removed. If
@@ -43,72 +312,172 @@ def wrap_text_to_pixels(
         input text at ``max_width`` pixels size
     :rtype: List[str]
 
+    """
+    return list(
+        iter_wrap_text_to_pixels(_pieces(string), max_width, font, indent0, indent1)
+    )
+
+
+def _pieces(string: str, size: int = 64) -> Iterator[str]:
+    # string in slices of size characters
+    for start in range(0, len(string), size):
+        yield string[start : start + size]
+
+
+def _loaded(chunks: Iterable[str], glyphs: GlyphCache) -> Iterator[str]:
+    # The chunks in slices whose glyphs are loaded just before they are yielded
+    size = glyphs._batch_size()  # pylint: disable=protected-access
+    for chunk in chunks:
+        for piece in _pieces(chunk, size):
+            glyphs.load_glyphs(piece)
+            yield piece
+
+
+def _then(chunks: Iterable[str], last: Optional[str]) -> Iterator[Optional[str]]:
+    # The chunks followed by last, which marks the end of the text
+    for chunk in chunks:
+        yield chunk
+    yield last
+
+
+def iter_wrap_text_to_pixels(
+    chunks: Iterable[str],
+    max_width: int,
+    font: Optional[Union[BuiltinFont, BDF, PCF]] = None,
+    indent0: str = "",
+    indent1: str = "",
+) -> Iterator[str]:
+    # pylint: disable=too-many-branches, too-many-locals, too-many-statements
+
+    """iter_wrap_text_to_pixels function
+    Generator version of `wrap_text_to_pixels`, wrapping text that arrives in
+    chunks, like the lines of a file or the reads of a UART. Each line is yielded
+    as soon as it is final. Only the current line and word are held in memory,
+    whatever the length of the text.
+
+    :param chunks: The text to be wrapped, as an iterable of strings.
+    :param int max_width: The maximum number of pixels on a line before wrapping.
+    :param font: The font to use for measuring the text.
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param str indent0: Additional character(s) to add to the first line.
+    :param str indent1: Additional character(s) to add to all other lines.
+
+    :return: The lines resulting from wrapping the text at ``max_width`` pixels
+        size, the same as `wrap_text_to_pixels` returns for the joined chunks
+    :rtype: Iterator[str]
+
     """
     if font is None:
 
+        def advance(char):  # pylint: disable=unused-argument
+            return 1
+
         def measure(text):
             return len(text)
 
     else:
-        if hasattr(font, "load_glyphs"):
-            font.load_glyphs(string)
+        glyphs = glyph_cache(font)
+        # Slices of no more characters than the cache loads at once, loaded
+        # before they are wrapped, so their glyphs are still held when measured
+        chunks = _loaded(chunks, glyphs)
 
-        def measure(text):
-            return sum(font.get_glyph(ord(c)).shift_x for c in text)
+        def advance(char):
+            return glyphs.get_glyph(ord(char)).shift_x
 
-    lines = []
+        def measure(text):
+            width = 0
+            for char in text:
+                width += advance(char)
+            return width
+
+    # The widths are kept up to date as the line grows instead of measuring the
+    # line again, so wrapping takes time linear in the length of the text.
+    # width is the width of the line as the word wrapping sees it, partial_width
+    # the width of "".join(partial).
     partial = [indent0]
-    width = measure(indent0)
-    swidth = measure(" ")
+    partial_width = width = measure(indent0)
+    swidth = glyphs.space_width if font is not None else 1
+    indent1_width = measure(indent1)
+    hyphen_width = None
     firstword = True
-    for line_in_input in string.split("\n"):
-        for index, word in enumerate(line_in_input.split(" ")):
-            wwidth = measure(word)
-            word_parts = []
-            cur_part = ""
-
-            if wwidth > max_width:
-                for char in word:
+    index = 0  # of the word in the input line
+    # The characters of the word, or once it is known to be too long for a line,
+    # of the part of it that goes on the current line
+    word = []
+    word_width = 0
+    long_word = False
+
+    # A newline after the text ends the last line like any other line
+    for chunk in _then(chunks, None):
+        if chunk is None:
+            chunk = "\n"
+
+        for char in chunk:
+            if char not in (" ", "\n"):
+                if long_word:
+                    replay = char
+                else:
+                    word.append(char)
+                    word_width += advance(char)
+                    if word_width <= max_width:
+                        continue
+                    # Split the word from here on, starting with what it has so far
+                    long_word = True
+                    if hyphen_width is None:
+                        hyphen_width = glyphs.hyphen_width if font is not None else 1
+                    replay, word, word_width = word, [], 0
+
+                for part_char in replay:
+                    char_width = advance(part_char)
                     if (
-                        measure("".join(partial))
-                        + measure(cur_part)
-                        + measure(char)
-                        + measure("-")
+                        partial_width + word_width + char_width + hyphen_width
                         > max_width
                     ):
-                        word_parts.append("".join(partial) + cur_part + "-")
-                        cur_part = char
+                        yield "".join(partial) + "".join(word) + "-"
+                        word = [part_char]
+                        word_width = char_width
                         partial = [indent1]
+                        partial_width = indent1_width
                     else:
-                        cur_part += char
-                if cur_part:
-                    word_parts.append(cur_part)
-                for line in word_parts[:-1]:
-                    lines.append(line)
-                partial.append(word_parts[-1])
-                width = measure(word_parts[-1])
+                        word.append(part_char)
+                        word_width += char_width
+                continue
+
+            # The end of a word
+            if long_word or word_width > max_width:
+                partial.append("".join(word))
+                partial_width += word_width
+                width = word_width
                 if firstword:
                     firstword = False
             else:
                 if firstword:
-                    partial.append(word)
+                    partial.append("".join(word))
                     firstword = False
-                    width += wwidth
-                elif width + swidth + wwidth < max_width:
+                    width += word_width
+                    partial_width += word_width
+                elif width + swidth + word_width < max_width:
                     if index > 0:
                         partial.append(" ")
-                    partial.append(word)
-                    width += wwidth + swidth
+                        partial_width += swidth
+                    partial.append("".join(word))
+                    width += word_width + swidth
+                    partial_width += word_width
                 else:
-                    lines.append("".join(partial))
-                    partial = [indent1, word]
-                    width = measure(indent1) + wwidth
-
-        lines.append("".join(partial))
-        partial = [indent1]
-        width = measure(indent1)
-
-    return lines
+                    yield "".join(partial)
+                    partial = [indent1, "".join(word)]
+                    width = partial_width = indent1_width + word_width
+            word = []
+            word_width = 0
+            long_word = False
+
+            if char == "\n":
+                yield "".join(partial)
+                partial = [indent1]
+                width = partial_width = indent1_width
+                index = 0
+            else:
+                index += 1
 
 
 def wrap_text_to_lines(string: str, max_chars: int) -> List[str]:
@@ -122,43 +491,78 @@ def wrap_text_to_lines(string: str, max_chars: int) -> List[str]:
         of ``max_chars`` provided
     :rtype: List[str]
     """
+    return list(iter_wrap_text_to_lines((string,), max_chars))
+
 
-    def chunks(lst, n):
-        """Yield successive n-sized chunks from lst."""
-        for i in range(0, len(lst), n):
-            yield lst[i : i + n]
+def iter_wrap_text_to_lines(chunks: Iterable[str], max_chars: int) -> Iterator[str]:
+    """iter_wrap_text_to_lines function
+    Generator version of `wrap_text_to_lines`, wrapping text that arrives in
+    chunks, like the lines of a file or the reads of a UART. Each line is yielded
+    as soon as it is final. Only the current line and word are held in memory,
+    whatever the length of the text.
+
+    :param chunks: The text to be wrapped, as an iterable of strings
+    :param int max_chars: The maximum number of characters on a line before wrapping
 
-    string = string.replace("\n", "").replace("\r", "")  # Strip confusing newlines
-    words = string.split(" ")
-    the_lines = []
+    :return: The lines resulting from wrapping the text, the same as
+        `wrap_text_to_lines` returns for the joined chunks
+    :rtype: Iterator[str]
+    """
+    first = True
+    for line in _wrap_lines(chunks, max_chars):
+        if first:
+            # Remove any blank lines and the first space from the first line
+            if not line:
+                continue
+            first = False
+            if line[0] == " ":
+                line = line[1:]
+        yield line
+
+
+def _wrap_lines(chunks: Iterable[str], max_chars: int) -> Iterator[str]:
+    # pylint: disable=too-many-branches
+    split = max_chars - 1  # characters of a long word per line, before the "-"
     the_line = ""
-    for w in words:
-        if len(w) > max_chars:
-            if the_line:  # add what we had stored
-                the_lines.append(the_line)
-            parts = []
-            for part in chunks(w, max_chars - 1):
-                parts.append("{}-".format(part))
-            the_lines.extend(parts[:-1])
-            the_line = parts[-1][:-1]
-            continue
-
-        if len(the_line + " " + w) <= max_chars:
-            the_line += " " + w
-        elif not the_line and len(w) == max_chars:
-            the_lines.append(w)
-        else:
-            the_lines.append(the_line)
-            the_line = "" + w
+    word = []
+    long_word = False
+    # A space after the text ends the last word like any other word
+    for chunk in _then(chunks, " "):
+        for char in chunk:
+            if char in ("\n", "\r"):  # Strip confusing newlines
+                continue
+            if char != " ":
+                word.append(char)
+                if long_word:
+                    if len(word) > split:
+                        yield "".join(word[:split]) + "-"
+                        word = word[split:]
+                elif len(word) > max_chars:
+                    if split < 1:
+                        raise ValueError("max_chars must be at least 2 to split words")
+                    long_word = True
+                    if the_line:  # add what we had stored
+                        yield the_line
+                    while len(word) > split:
+                        yield "".join(word[:split]) + "-"
+                        word = word[split:]
+                continue
+
+            # The end of a word
+            w = "".join(word)
+            word = []
+            if long_word:
+                long_word = False
+                the_line = w
+            elif len(the_line) + 1 + len(w) <= max_chars:
+                the_line += " " + w
+            elif not the_line and len(w) == max_chars:
+                yield w
+            else:
+                yield the_line
+                the_line = "" + w
     if the_line:  # Last line remaining
-        the_lines.append(the_line)
-    # Remove any blank lines
-    while not the_lines[0]:
-        del the_lines[0]
-    # Remove first space from first line:
-    if the_lines[0][0] == " ":
-        the_lines[0] = the_lines[0][1:]
-    return the_lines
+        yield the_line
 
 
 class LabelBase(Group):
@@ -248,6 +652,7 @@ class LabelBase(Group):
 
         self._ascent, self._descent = self._get_ascent_descent()
         self._bounding_box = None
+        self._defer_placement = False  # set while update() applies its changes
 
         self.color = color
         self.background_color = background_color
@@ -267,24 +672,7 @@ class LabelBase(Group):
 
     def _get_ascent_descent(self) -> Tuple[int, int]:
         """ Private function to calculate ascent and descent font values """
-        if hasattr(self.font, "ascent") and hasattr(self.font, "descent"):
-            return self.font.ascent, self.font.descent
-
-        # check a few glyphs for maximum ascender and descender height
-        glyphs = "M j'"  # choose glyphs with highest ascender and lowest
-        try:
-            self._font.load_glyphs(glyphs)
-        except AttributeError:
-            # Builtin font doesn't have or need load_glyphs
-            pass
-        # descender, will depend upon font used
-        ascender_max = descender_max = 0
-        for char in glyphs:
-            this_glyph = self._font.get_glyph(ord(char))
-            if this_glyph:
-                ascender_max = max(ascender_max, this_glyph.height + this_glyph.dy)
-                descender_max = max(descender_max, -this_glyph.dy)
-        return ascender_max, descender_max
+        return glyph_cache(self._font).ascent_descent
 
     @property
     def font(self) -> Union[BuiltinFont, BDF, PCF]:
@@ -353,6 +741,8 @@ class LabelBase(Group):
     @anchored_position.setter
     def anchored_position(self, new_position: Tuple[int, int]) -> None:
         self._anchored_position = new_position
+        if self._defer_placement:
+            return  # update() places the label once it is done
         # Calculate (x,y) position
         if (self._anchor_point is not None) and (self._anchored_position is not None):
             self.x = int(
@@ -391,6 +781,42 @@ class LabelBase(Group):
     def text(self, new_text: str) -> None:
         self._set_text(new_text, self.scale)
 
+    def update(
+        self,
+        text: Optional[str] = None,
+        scale: Optional[int] = None,
+        anchor_point: Optional[Tuple[float, float]] = None,
+        anchored_position: Optional[Tuple[int, int]] = None,
+        color: Optional[int] = None,
+    ) -> None:
+        """Change several properties at once. Setting them one by one lays the
+        text out or places the label again after each of them, ``update`` lays
+        out the text once and places the label once. Properties left as `None`
+        keep their value.
+
+        :param str text: Text to display
+        :param int scale: Integer value of the pixel scaling
+        :param (float,float) anchor_point: Point that anchored_position moves
+         relative to
+        :param (int,int) anchored_position: Position relative to the anchor_point
+        :param int color: Color of the text as an RGB hex number
+        """
+        self._defer_placement = True
+        try:
+            if color is not None:
+                self.color = color
+            if anchor_point is not None:
+                self.anchor_point = anchor_point
+            if anchored_position is not None:
+                self.anchored_position = anchored_position
+            if scale is not None:
+                self.scale = scale
+            if text is not None:
+                self._set_text(text, self.scale)
+        finally:
+            self._defer_placement = False
+        self.anchored_position = self._anchored_position
+
     @property
     def bounding_box(self) -> Tuple[int, int]:
         """An (x, y, w, h) tuple that completely covers all glyphs. The
@@ -35,9 +35,41 @@ try:
 except ImportError:
     pass
 
+from array import array
 import displayio
 
-from adafruit_display_text import LabelBase
+try:
+    import bitmaptools
+except ImportError:
+    bitmaptools = None  # clear areas pixel by pixel instead
+
+from adafruit_display_text import LabelBase, OrderedDict, glyph_cache
+
+# Laid out text from Label._layout by (font, text, line_spacing), shared by all
+# labels so a string shown before isn't measured again
+_LAYOUT_CACHE_SIZE = 16
+_layout_cache = OrderedDict()
+
+
+class _GlyphRun:
+    """Text laid out once: the glyphs with their code points and pen positions in
+    parallel arrays, plus the box sizes of the text. Drives both the sizing of
+    the bitmap and the blitting of the glyphs into it."""
+
+    def __init__(self) -> None:
+        self.glyphs = []
+        self.codepoints = array("L")
+        self.x = array("h")
+        self.y = array("h")
+        # (width, tight height, x offset, tight y offset, loose height, loose y offset)
+        self.box = None
+
+    def append(self, glyph, codepoint: int, x: int, y: int) -> None:
+        """Add ``glyph`` for ``codepoint`` with its pen position"""
+        self.glyphs.append(glyph)
+        self.codepoints.append(codepoint)
+        self.x.append(x)
+        self.y.append(y)
 
 
 class Label(LabelBase):
@@ -82,18 +114,34 @@ class Label(LabelBase):
      tab character
     :param str label_direction: string defining the label text orientation. There are 5
      configurations possibles ``LTR``-Left-To-Right ``RTL``-Right-To-Left
-     ``UPD``-Upside Down ``UPR``-Upwards ``DWR``-Downwards. It defaults to ``LTR``"""
+     ``UPD``-Upside Down ``UPR``-Upwards ``DWR``-Downwards. It defaults to ``LTR``
+    :param (int,int) max_size: Allocate the bitmap once with this (width, height) and
+     never reallocate it, text that doesn't fit is clipped. The background color covers
+     the whole area. Only for ``LTR`` and ``RTL`` labels. Without it the bitmap is
+     reused whenever the new text fits and reallocated otherwise."""
 
     def __init__(
-        self, font: Union[BuiltinFont, BDF, PCF], save_text: bool = True, **kwargs
+        self,
+        font: Union[BuiltinFont, BDF, PCF],
+        save_text: bool = True,
+        max_size: Optional[Tuple[int, int]] = None,
+        **kwargs
     ) -> None:
 
         self._bitmap = None
+        self._tilegrid = None
+        self._max_size = max_size
+        # Part of the bitmap written by the last update, cleared before the next one
+        self._drawn_size = (0, 0)
+        # (run, xposition, yposition) of the text in the bitmap, to redraw only the
+        # characters that changed
+        self._placed = None
 
         super().__init__(font, **kwargs)
 
         self._save_text = save_text
         self._text = self._replace_tabs(self._text)
+        self._check_max_size(self._label_direction)
 
         if self._label_direction == "RTL":
             self._text = "".join(reversed(self._text))
@@ -155,6 +203,7 @@ class Label(LabelBase):
 
             # Calculate both "tight" and "loose" bounding box dimensions to match label for
             # anchor_position calculations
+            run = self._layout(text, self._font)
             (
                 box_x,
                 tight_box_y,
@@ -162,10 +211,7 @@ class Label(LabelBase):
                 tight_y_offset,
                 loose_box_y,
                 loose_y_offset,
-            ) = self._text_bounding_box(
-                text,
-                self._font,
-            )  # calculate the box size for a tight and loose backgrounds
+            ) = run.box  # the box size for a tight and loose backgrounds
 
             if self._background_tight:
                 box_y = tight_box_y
@@ -179,52 +225,85 @@ class Label(LabelBase):
             box_x = box_x + self._padding_left + self._padding_right
             box_y = box_y + self._padding_top + self._padding_bottom
 
-            # Create the bitmap and TileGrid
-            self._bitmap = displayio.Bitmap(box_x, box_y, len(self._palette))
-
-            # Place the text into the Bitmap
-            self._place_text(
-                self._bitmap,
-                text,
-                self._font,
-                self._padding_left - x_offset,
-                self._padding_top + y_offset,
-            )
+            xposition = self._padding_left - x_offset
+            yposition = self._padding_top + y_offset
+            drawn_size = (box_x, box_y)
+            bitmap_size = self._bitmap_size(box_x, box_y)
+            if self._bitmap_fits(*bitmap_size):
+                drawn_size = (
+                    min(box_x, self._bitmap.width),
+                    min(box_y, self._bitmap.height),
+                )
+                if drawn_size != self._drawn_size or not self._update_changed(
+                    run, xposition, yposition
+                ):
+                    # Reuse the bitmap, only clearing what the previous text covered
+                    self._clear_area(self._bitmap, 0, 0, *self._drawn_size)
+                    self._placed = None
+            else:
+                # Create the bitmap, the TileGrid has to follow
+                self._bitmap = displayio.Bitmap(
+                    bitmap_size[0], bitmap_size[1], len(self._palette)
+                )
+                self._tilegrid = None
+                self._placed = None
+                drawn_size = (
+                    min(box_x, self._bitmap.width),
+                    min(box_y, self._bitmap.height),
+                )
+            self._drawn_size = drawn_size
+
+            if self._placed is None:
+                # Place the text into the Bitmap
+                self._place_text(
+                    self._bitmap,
+                    run,
+                    xposition,
+                    yposition,
+                    width=drawn_size[0],
+                    height=drawn_size[1],
+                )
+            self._placed = (run, xposition, yposition)
 
             if self._base_alignment:
                 label_position_yoffset = 0
             else:
                 label_position_yoffset = self._ascent // 2
 
-            self._tilegrid = displayio.TileGrid(
-                self._bitmap,
-                pixel_shader=self._palette,
-                width=1,
-                height=1,
-                tile_width=box_x,
-                tile_height=box_y,
-                default_tile=0,
-                x=-self._padding_left + x_offset,
-                y=label_position_yoffset - y_offset - self._padding_top,
-            )
+            if self._tilegrid is None:
+                self._tilegrid = displayio.TileGrid(
+                    self._bitmap,
+                    pixel_shader=self._palette,
+                    width=1,
+                    height=1,
+                    tile_width=self._bitmap.width,
+                    tile_height=self._bitmap.height,
+                    default_tile=0,
+                )
 
-            if self._label_direction == "UPR":
-                self._tilegrid.transpose_xy = True
-                self._tilegrid.flip_x = True
-            if self._label_direction == "DWR":
-                self._tilegrid.transpose_xy = True
-                self._tilegrid.flip_y = True
-            if self._label_direction == "UPD":
-                self._tilegrid.flip_x = True
-                self._tilegrid.flip_y = True
-
-            # Clear out any items in the local_group Group, in case this is an update to
-            # the bitmap_label
-            for _ in self._local_group:
-                self._local_group.pop(0)
-            self._local_group.append(
-                self._tilegrid
-            )  # add the bitmap's tilegrid to the group
+                if self._label_direction == "UPR":
+                    self._tilegrid.transpose_xy = True
+                    self._tilegrid.flip_x = True
+                if self._label_direction == "DWR":
+                    self._tilegrid.transpose_xy = True
+                    self._tilegrid.flip_y = True
+                if self._label_direction == "UPD":
+                    self._tilegrid.flip_x = True
+                    self._tilegrid.flip_y = True
+            self._tilegrid.x = -self._padding_left + x_offset
+            self._tilegrid.y = label_position_yoffset - y_offset - self._padding_top
+
+            if (
+                len(self._local_group) != 1
+                or self._local_group[0] is not self._tilegrid
+            ):
+                # Clear out any items in the local_group Group, in case this is an
+                # update to the bitmap_label
+                for _ in self._local_group:
+                    self._local_group.pop(0)
+                self._local_group.append(
+                    self._tilegrid
+                )  # add the bitmap's tilegrid to the group
 
             # Update bounding_box values.  Note: To be consistent with label.py,
             # this is the bounding box for the text only, not including the background.
@@ -252,19 +331,166 @@ class Label(LabelBase):
         # x,y positions of the label
         self.anchored_position = self._anchored_position
 
+    def _update_changed(self, run: "_GlyphRun", xposition: int, yposition: int) -> bool:
+        """Redraw only the characters of ``run`` that differ from the text in the
+        bitmap. Returns `False`, without drawing, unless every glyph stays in place."""
+        # pylint: disable=too-many-locals
+        if self._placed is None:
+            return False
+        old, old_xposition, old_yposition = self._placed
+        if (
+            old_xposition != xposition
+            or old_yposition != yposition
+            or len(old.glyphs) != len(run.glyphs)
+        ):
+            return False
+        for i in range(len(run.glyphs)):
+            if old.x[i] != run.x[i] or old.y[i] != run.y[i]:
+                return False
+
+        # Merge neighbouring changed characters of a line into one area
+        width, height = self._drawn_size
+        area = None
+        for i, my_glyph in enumerate(run.glyphs):
+            old_glyph = old.glyphs[i]
+            if old_glyph is my_glyph:
+                if area is not None:
+                    self._redraw_area(run, xposition, yposition, area)
+                    area = None
+                continue
+            x = xposition + run.x[i]
+            y = yposition + run.y[i]
+            x_1 = x + min(old_glyph.dx, my_glyph.dx)
+            x_2 = x + max(old_glyph.dx + old_glyph.width, my_glyph.dx + my_glyph.width)
+            y_1 = y - max(
+                old_glyph.height + old_glyph.dy, my_glyph.height + my_glyph.dy
+            )
+            y_2 = y - min(old_glyph.dy, my_glyph.dy)
+            if area is not None and area[4] == y:
+                area = (
+                    min(area[0], x_1),
+                    min(area[1], y_1),
+                    max(area[2], x_2),
+                    max(area[3], y_2),
+                    y,
+                )
+            else:
+                if area is not None:
+                    self._redraw_area(run, xposition, yposition, area)
+                area = (x_1, y_1, x_2, y_2, y)
+        if area is not None:
+            self._redraw_area(run, xposition, yposition, area)
+        return True
+
+    def _redraw_area(
+        self, run: "_GlyphRun", xposition: int, yposition: int, area: Tuple[int, ...]
+    ) -> None:
+        # Clear the area and draw the parts of the glyphs inside it again, so the
+        # unchanged neighbours of a changed character stay intact
+        x_1 = max(area[0], 0)
+        y_1 = max(area[1], 0)
+        x_2 = min(area[2], self._drawn_size[0])
+        y_2 = min(area[3], self._drawn_size[1])
+        if x_1 >= x_2 or y_1 >= y_2:
+            return
+        self._clear_area(self._bitmap, x_1, y_1, x_2, y_2)
+        for i, my_glyph in enumerate(run.glyphs):
+            left = xposition + run.x[i] + my_glyph.dx
+            top = yposition + run.y[i] - my_glyph.height - my_glyph.dy
+            glyph_x1 = max(left, x_1)
+            glyph_y1 = max(top, y_1)
+            glyph_x2 = min(left + my_glyph.width, x_2)
+            glyph_y2 = min(top + my_glyph.height, y_2)
+            if glyph_x1 >= glyph_x2 or glyph_y1 >= glyph_y2:
+                continue
+            glyph_offset_x = my_glyph.tile_index * my_glyph.width - left
+            self._blit(
+                self._bitmap,
+                glyph_x1,
+                glyph_y1,
+                my_glyph.bitmap,
+                x_1=glyph_offset_x + glyph_x1,
+                y_1=glyph_y1 - top,
+                x_2=glyph_offset_x + glyph_x2,
+                y_2=glyph_y2 - top,
+                skip_index=0,
+            )
+
+    def _bitmap_size(self, width: int, height: int) -> Tuple[int, int]:
+        """Size of the bitmap to create for a ``width`` x ``height`` text box"""
+        if self._max_size is not None:
+            return self._max_size
+        return width, height
+
+    def _bitmap_fits(self, width: int, height: int) -> bool:
+        """Whether the current bitmap can be reused where a ``width`` x ``height``
+        bitmap is needed"""
+        if self._bitmap is None:
+            return False
+        if self._bitmap.width == width and self._bitmap.height == height:
+            return True
+        # A bigger bitmap shows as a bigger background, and the flipped directions
+        # would move the text into the unused part
+        return (
+            self._background_color is None
+            and self._label_direction in ("LTR", "RTL")
+            and width <= self._bitmap.width
+            and height <= self._bitmap.height
+        )
+
+    def _check_max_size(self, label_direction: str) -> None:
+        if self._max_size is not None and label_direction not in ("LTR", "RTL"):
+            raise ValueError("max_size is only supported for LTR and RTL labels")
+
+    @staticmethod
+    def _clear_area(
+        bitmap: displayio.Bitmap, x_1: int, y_1: int, x_2: int, y_2: int
+    ) -> None:
+        # Set the x_1, y_1 to x_2, y_2 area of the bitmap to the background index, only
+        # this area gets refreshed instead of the whole bitmap
+        if x_1 >= x_2 or y_1 >= y_2:
+            return
+        if bitmaptools is not None:
+            bitmaptools.fill_region(bitmap, x_1, y_1, x_2, y_2, 0)
+            return
+        width = bitmap.width
+        for row in range(y_1 * width, y_2 * width, width):
+            for index in range(row + x_1, row + x_2):
+                bitmap[index] = 0
+
     @staticmethod
     def _line_spacing_ypixels(
         font: Union[BuiltinFont, BDF, PCF], line_spacing: float
     ) -> int:
         # Note: Scaling is provided at the Group level
-        return_value = int(line_spacing * font.get_bounding_box()[1])
+        return_value = int(line_spacing * glyph_cache(font).bounding_box[1])
         return return_value
 
-    def _text_bounding_box(
+    def _layout(self, text: str, font: Union[BuiltinFont, BDF, PCF]) -> "_GlyphRun":
+        key = (font, text, self._line_spacing)
+        run = _layout_cache.pop(key, None)
+        if run is None:
+            run = self._layout_text(text, font)
+            if len(_layout_cache) >= _LAYOUT_CACHE_SIZE:
+                del _layout_cache[next(iter(_layout_cache))]  # least recently used
+        _layout_cache[key] = run  # (re)insert as the most recently used
+        return run
+
+    def _layout_text(
         self, text: str, font: Union[BuiltinFont, BDF, PCF]
-    ) -> Tuple[int, int, int, int, int, int]:
+    ) -> "_GlyphRun":
         # pylint: disable=too-many-locals
 
+        # Walks the text once, recording where each glyph goes for _place_text and
+        # calculating both "tight" and "loose" bounding box dimensions to match
+        # label for anchor_position calculations
+
+        glyphs = glyph_cache(font)
+        if glyphs.monospace is not None:
+            return self._layout_monospace(text, font, glyphs)
+
+        run = _GlyphRun()
+
         ascender_max, descender_max = self._ascent, self._descent
 
         lines = 1
@@ -272,6 +498,9 @@ class Label(LabelBase):
         xposition = (
             x_start
         ) = yposition = y_start = 0  # starting x and y position (left margin)
+        # Glyphs are placed one line further down for every newline, even when
+        # the line is empty, while the box only counts lines holding glyphs
+        y_place = y_start
 
         left = None
         right = x_start
@@ -280,16 +509,17 @@ class Label(LabelBase):
         y_offset_tight = self._ascent // 2
 
         newline = False
-        line_spacing = self._line_spacing
+        line_spacing_ypixels = self._line_spacing_ypixels(font, self._line_spacing)
 
         for char in text:
 
             if char == "\n":  # newline
                 newline = True
+                y_place += line_spacing_ypixels
 
             else:
 
-                my_glyph = font.get_glyph(ord(char))
+                my_glyph = glyphs.get_glyph(ord(char))
 
                 if my_glyph is None:  # Error checking: no glyph found
                     print("Glyph not found: {}".format(repr(char)))
@@ -297,15 +527,14 @@ class Label(LabelBase):
                     if newline:
                         newline = False
                         xposition = x_start  # reset to left column
-                        yposition = yposition + self._line_spacing_ypixels(
-                            font, line_spacing
-                        )  # Add a newline
+                        yposition = yposition + line_spacing_ypixels  # Add a newline
                         lines += 1
                     if xposition == x_start:
                         if left is None:
                             left = my_glyph.dx
                         else:
                             left = min(left, my_glyph.dx)
+                    run.append(my_glyph, ord(char), xposition, y_place)
                     xright = xposition + my_glyph.width + my_glyph.dx
                     xposition += my_glyph.shift_x
 
@@ -323,14 +552,12 @@ class Label(LabelBase):
         final_box_height_tight = bottom - top
         final_y_offset_tight = -top + y_offset_tight
 
-        final_box_height_loose = (lines - 1) * self._line_spacing_ypixels(
-            font, line_spacing
-        ) + (ascender_max + descender_max)
+        final_box_height_loose = (lines - 1) * line_spacing_ypixels + (
+            ascender_max + descender_max
+        )
         final_y_offset_loose = ascender_max
 
-        # return (final_box_width, final_box_height, left, final_y_offset)
-
-        return (
+        run.box = (
             final_box_width,
             final_box_height_tight,
             left,
@@ -338,105 +565,149 @@ class Label(LabelBase):
             final_box_height_loose,
             final_y_offset_loose,
         )
+        return run
+
+    def _layout_monospace(
+        self, text: str, font: Union[BuiltinFont, BDF, PCF], glyphs
+    ) -> "_GlyphRun":
+        # pylint: disable=too-many-locals
+
+        # Same result as _layout_text for a fixed width font. Every glyph has the
+        # metrics of the cell, so the pen position is the glyph count of the line
+        # times the advance and the box follows from the line lengths alone.
+
+        run = _GlyphRun()
+        cell = glyphs.monospace
+        shift_x = cell.shift_x
+        line_spacing_ypixels = self._line_spacing_ypixels(font, self._line_spacing)
+
+        y_place = 0
+        count = 0  # glyphs on the current line
+        longest = 0
+        first_line = None  # index of the first line holding glyphs
+        line_index = 0
+        glyph_lines = 0
+
+        for char in text + "\n":
+            if char == "\n":
+                if count:
+                    if first_line is None:
+                        first_line = line_index
+                    glyph_lines += 1
+                    longest = max(longest, count)
+                    count = 0
+                line_index += 1
+                y_place += line_spacing_ypixels
+                continue
+
+            my_glyph = glyphs.get_glyph(ord(char))
+            if my_glyph is None:  # Error checking: no glyph found
+                print("Glyph not found: {}".format(repr(char)))
+                continue
+            run.append(my_glyph, ord(char), count * shift_x, y_place)
+            count += 1
+
+        # The box moves one line down for each line holding glyphs that isn't the
+        # first line of the text, however many newlines are in between
+        newlines = glyph_lines - 1 if first_line == 0 else glyph_lines
+        lines = newlines + 1
+
+        y_offset_tight = self._ascent // 2
+        left = right = top = bottom = 0
+        if glyph_lines:
+            left = cell.dx
+            right = max(
+                0, longest * shift_x, (longest - 1) * shift_x + cell.width + cell.dx
+            )
+            lowest = max(
+                (0 if first_line == 0 else 1) * line_spacing_ypixels,
+                newlines * line_spacing_ypixels,
+            )
+            if first_line == 0 or line_spacing_ypixels == 0:
+                top = min(0, -cell.height - cell.dy + y_offset_tight)
+            bottom = max(0, lowest - cell.dy + y_offset_tight)
+
+        run.box = (
+            right - left,
+            bottom - top,
+            left,
+            -top + y_offset_tight,
+            (lines - 1) * line_spacing_ypixels + (self._ascent + self._descent),
+            self._ascent,
+        )
+        return run
 
     def _place_text(
         self,
         bitmap: displayio.Bitmap,
-        text: str,
-        font: Union[BuiltinFont, BDF, PCF],
+        run: "_GlyphRun",
         xposition: int,
         yposition: int,
         skip_index: int = 0,  # set to None to write all pixels, other wise skip this palette index
         # when copying glyph bitmaps (this is important for slanted text
         # where rectangular glyph boxes overlap)
-    ) -> Tuple[int, int, int, int]:
+        # clip to this width and height instead of the bitmap's, for reused
+        # bitmaps bigger than the text
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
         # pylint: disable=too-many-arguments, too-many-locals
 
-        # placeText - Writes text into a bitmap at the specified location.
+        # placeText - Writes the laid out text into a bitmap at the specified location.
         #
         # Note: scale is pushed up to Group level
 
-        x_start = xposition  # starting x position (left margin)
-        y_start = yposition
-
-        left = None
-        right = x_start
-        top = bottom = y_start
-        line_spacing = self._line_spacing
-
-        for char in text:
-
-            if char == "\n":  # newline
-                xposition = x_start  # reset to left column
-                yposition = yposition + self._line_spacing_ypixels(
-                    font, line_spacing
-                )  # Add a newline
-
-            else:
-
-                my_glyph = font.get_glyph(ord(char))
-
-                if my_glyph is None:  # Error checking: no glyph found
-                    print("Glyph not found: {}".format(repr(char)))
-                else:
-                    if xposition == x_start:
-                        if left is None:
-                            left = my_glyph.dx
-                        else:
-                            left = min(left, my_glyph.dx)
-
-                    right = max(
-                        right,
-                        xposition + my_glyph.shift_x,
-                        xposition + my_glyph.width + my_glyph.dx,
-                    )
-                    if yposition == y_start:  # first line, find the Ascender height
-                        top = min(top, -my_glyph.height - my_glyph.dy)
-                    bottom = max(bottom, yposition - my_glyph.dy)
-
-                    glyph_offset_x = (
-                        my_glyph.tile_index * my_glyph.width
-                    )  # for type BuiltinFont, this creates the x-offset in the glyph bitmap.
-                    # for BDF loaded fonts, this should equal 0
-
-                    y_blit_target = yposition - my_glyph.height - my_glyph.dy
-
-                    # Clip glyph y-direction if outside the font ascent/descent metrics.
-                    # Note: bitmap.blit will automatically clip the bottom of the glyph.
-                    y_clip = 0
-                    if y_blit_target < 0:
-                        y_clip = -y_blit_target  # clip this amount from top of bitmap
-                        y_blit_target = 0  # draw the clipped bitmap at y=0
-
-                        print(
-                            'Warning: Glyph clipped, exceeds Ascent property: "{}"'.format(
-                                char
-                            )
-                        )
-
-                    if (y_blit_target + my_glyph.height) > bitmap.height:
-                        print(
-                            'Warning: Glyph clipped, exceeds descent property: "{}"'.format(
-                                char
-                            )
-                        )
-
-                    self._blit(
-                        bitmap,
-                        xposition + my_glyph.dx,
-                        y_blit_target,
-                        my_glyph.bitmap,
-                        x_1=glyph_offset_x,
-                        y_1=y_clip,
-                        x_2=glyph_offset_x + my_glyph.width,
-                        y_2=my_glyph.height,
-                        skip_index=skip_index,  # do not copy over any 0 background pixels
+        if width is None:
+            width = bitmap.width
+        if height is None:
+            height = bitmap.height
+
+        for i, my_glyph in enumerate(run.glyphs):
+            glyph_offset_x = (
+                my_glyph.tile_index * my_glyph.width
+            )  # for type BuiltinFont, this creates the x-offset in the glyph bitmap.
+            # for BDF loaded fonts, this should equal 0
+
+            y_blit_target = yposition + run.y[i] - my_glyph.height - my_glyph.dy
+
+            # Clip glyph y-direction if outside the font ascent/descent metrics.
+            # Note: bitmap.blit will automatically clip the bottom of the glyph.
+            y_clip = 0
+            if y_blit_target < 0:
+                y_clip = -y_blit_target  # clip this amount from top of bitmap
+                y_blit_target = 0  # draw the clipped bitmap at y=0
+
+                print(
+                    'Warning: Glyph clipped, exceeds Ascent property: "{}"'.format(
+                        chr(run.codepoints[i])
                     )
+                )
 
-                    xposition = xposition + my_glyph.shift_x
+            if (y_blit_target + my_glyph.height) > height:
+                print(
+                    'Warning: Glyph clipped, exceeds descent property: "{}"'.format(
+                        chr(run.codepoints[i])
+                    )
+                )
 
-        # bounding_box
-        return left, top, right - left, bottom - top
+            x_blit_target = xposition + run.x[i] + my_glyph.dx
+            # Only needed when the bitmap is bigger than the width and height
+            x_2 = min(my_glyph.width, width - x_blit_target)
+            y_2 = min(my_glyph.height, height - y_blit_target + y_clip)
+            if x_2 <= 0 or y_2 <= y_clip:
+                continue
+
+            self._blit(
+                bitmap,
+                x_blit_target,
+                y_blit_target,
+                my_glyph.bitmap,
+                x_1=glyph_offset_x,
+                y_1=y_clip,
+                x_2=glyph_offset_x + x_2,
+                y_2=y_2,
+                skip_index=skip_index,  # do not copy over any 0 background pixels
+            )
 
     def _blit(
         self,
@@ -451,7 +722,7 @@ class Label(LabelBase):
         skip_index: int = None,  # palette index that will not be copied
         # (for example: the background color of a glyph)
     ) -> None:
-        # pylint: disable=no-self-use, too-many-arguments
+        # pylint: disable=no-self-use, too-many-arguments, too-many-locals
 
         if hasattr(bitmap, "blit"):  # if bitmap has a built-in blit function, call it
             # this function should perform its own input checks
@@ -466,7 +737,7 @@ class Label(LabelBase):
                 skip_index=skip_index,
             )
 
-        else:  # perform pixel by pixel copy of the bitmap
+        else:  # copy the bitmap row by row
 
             # Perform input checks
 
@@ -485,31 +756,36 @@ class Label(LabelBase):
             x_2 = min(x_2, source_bitmap.width)
             y_2 = min(y_2, source_bitmap.height)
 
-            for y_count in range(y_2 - y_1):
-                for x_count in range(x_2 - x_1):
-                    x_placement = x + x_count
-                    y_placement = y + y_count
-
-                    if (bitmap.width > x_placement >= 0) and (
-                        bitmap.height > y_placement >= 0
-                    ):  # ensure placement is within target bitmap
-
-                        # get the palette index from the source bitmap
-                        this_pixel_color = source_bitmap[
-                            y_1
-                            + (
-                                y_count * source_bitmap.width
-                            )  # Direct index into a bitmap array is speedier than [x,y] tuple
-                            + x_1
-                            + x_count
-                        ]
-
-                        if (skip_index is None) or (this_pixel_color != skip_index):
-                            bitmap[  # Direct index into a bitmap array is speedier than [x,y] tuple
-                                y_placement * bitmap.width + x_placement
-                            ] = this_pixel_color
-                    elif y_placement > bitmap.height:
-                        break
+            # Clip once against the target bitmap instead of checking every pixel
+            if x < 0:
+                x_1 -= x
+                x = 0
+            if y < 0:
+                y_1 -= y
+                y = 0
+            x_2 = min(x_2, x_1 + bitmap.width - x)
+            y_2 = min(y_2, y_1 + bitmap.height - y)
+            if x_1 >= x_2 or y_1 >= y_2:
+                return
+
+            # Copy row spans, moving the start indexes down a row at a time.
+            # Direct index into a bitmap array is speedier than [x,y] tuple
+            span = range(x_2 - x_1)
+            source_width = source_bitmap.width
+            target_width = bitmap.width
+            source_row = y_1 * source_width + x_1
+            target_row = y * target_width + x
+            for _ in range(y_2 - y_1):
+                if skip_index is None:
+                    for i in span:
+                        bitmap[target_row + i] = source_bitmap[source_row + i]
+                else:
+                    for i in span:
+                        this_pixel_color = source_bitmap[source_row + i]
+                        if this_pixel_color != skip_index:
+                            bitmap[target_row + i] = this_pixel_color
+                source_row += source_width
+                target_row += target_width
 
     def _set_line_spacing(self, new_line_spacing: float) -> None:
         if self._save_text:
@@ -535,9 +811,22 @@ class Label(LabelBase):
         else:
             self._palette[0] = 0
             self._palette.make_transparent(0)
+        if (
+            new_color is not None
+            and self._bitmap is not None
+            and self._save_text
+            and self._bitmap_size(*self._drawn_size)
+            != (self._bitmap.width, self._bitmap.height)
+        ):
+            # The reused bitmap is bigger than the text, shrink the now visible
+            # background to the text
+            self._bitmap = None
+            self._reset_text(scale=self.scale)
 
     def _set_label_direction(self, new_label_direction: str) -> None:
+        self._check_max_size(new_label_direction)
         self._label_direction = new_label_direction
+        self._tilegrid = None  # the flips and transposition change
         self._reset_text(text=str(self._text))  # Force a recalculation
 
     def _get_valid_label_directions(self) -> Tuple[str, ...]:
@@ -0,0 +1,241 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.font_atlas`
+================================================================================
+
+Packs glyphs of a BDF or PCF font into one shared bitmap
+
+
+* Author(s): Eric Ayers
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+import struct
+
+try:
+    from typing import List, Optional, Tuple, Union
+    from fontio import BuiltinFont
+    from adafruit_bitmap_font.bdf import BDF
+    from adafruit_bitmap_font.pcf import PCF
+except ImportError:
+    pass
+
+import displayio
+from fontio import Glyph
+
+_MAGIC = b"FATL"
+_VERSION = 1
+# magic, version, cell width, cell height, dx, dy, ascent, descent, glyph count
+_HEADER = ">4sBHHhhhhH"
+# code point, shift_x
+_ENTRY = ">Ih"
+
+
+class FontAtlas:
+    """A font whose glyphs are equally sized cells of a single bitmap, the way
+    ``terminalio.FONT`` keeps its glyphs. Both `label.Label` and
+    `bitmap_label.Label` accept it like any other font, and labels showing the
+    same atlas share the one bitmap.
+
+    Every glyph reports the size and offset of the cell, its ``tile_index`` is
+    the position of the cell in the bitmap. Only the advance ``shift_x`` differs
+    between glyphs, ``monospace`` is `True` when it doesn't. Create atlases
+    with `build_atlas` or `load_atlas`.
+
+    :param displayio.Bitmap bitmap: The cells side by side in a single row
+    :param int cell_width: Width of a cell in pixels
+    :param int cell_height: Height of a cell in pixels
+    :param int dx: Offset of the left of the cells from the cursor
+    :param int dy: Offset of the bottom of the cells from the baseline
+    :param list entries: ``(code_point, shift_x)`` of each cell, in the order of
+     the cells
+    :param int ascent: Pixels above the baseline of the tallest glyph
+    :param int descent: Pixels below the baseline of the lowest glyph
+    """
+
+    # pylint: disable=too-many-arguments
+
+    def __init__(
+        self,
+        bitmap: displayio.Bitmap,
+        cell_width: int,
+        cell_height: int,
+        dx: int,
+        dy: int,
+        entries: List[Tuple[int, int]],
+        ascent: int,
+        descent: int,
+    ) -> None:
+        self.bitmap = bitmap
+        self.ascent = ascent
+        self.descent = descent
+        self._bounding_box = (cell_width, cell_height, dx, dy)
+        self._entries = entries
+        self.monospace = len(set(shift_x for _, shift_x in entries)) == 1
+        self._glyphs = {}
+        for tile_index, (code_point, shift_x) in enumerate(entries):
+            self._glyphs[code_point] = Glyph(
+                bitmap, tile_index, cell_width, cell_height, dx, dy, shift_x, 0
+            )
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """The size and offset of the cells, ``(width, height, dx, dy)``"""
+        return self._bounding_box
+
+    def get_glyph(self, code_point: int) -> Optional[Glyph]:
+        """The glyph of ``code_point``, `None` if it isn't in the atlas"""
+        return self._glyphs.get(code_point)
+
+    def load_glyphs(self, code_points) -> None:
+        """Does nothing, the glyphs of an atlas are always loaded"""
+
+    def save(self, path: str) -> None:
+        """Write the atlas to a file that `load_atlas` reads back. The pixels
+        are stored with one bit each.
+
+        :param str path: Name of the file to write
+        """
+        width, height, dx, dy = self._bounding_box
+        bitmap = self.bitmap
+        with open(path, "wb") as file:
+            file.write(
+                struct.pack(
+                    _HEADER,
+                    _MAGIC,
+                    _VERSION,
+                    width,
+                    height,
+                    dx,
+                    dy,
+                    self.ascent,
+                    self.descent,
+                    len(self._entries),
+                )
+            )
+            for code_point, shift_x in self._entries:
+                file.write(struct.pack(_ENTRY, code_point, shift_x))
+            # 1 bit per pixel, rows padded to whole bytes, leftmost pixel in the
+            # most significant bit
+            row = bytearray((bitmap.width + 7) // 8)
+            for y in range(bitmap.height):
+                for index in range(len(row)):
+                    row[index] = 0
+                for x in range(bitmap.width):
+                    if bitmap[x, y]:
+                        row[x >> 3] |= 0x80 >> (x & 7)
+                file.write(row)
+
+
+def build_atlas(
+    font: Union[BuiltinFont, BDF, PCF], characters: str, value_count: int = 2
+) -> FontAtlas:
+    """Render the glyphs of ``characters`` in ``font`` into a `FontAtlas`.
+    Characters the font has no glyph for are left out.
+
+    Building copies every pixel of the glyphs, do it on the host with
+    ``make_font_atlas.py`` and `load_atlas` the file on the board, or once at
+    start up.
+
+    :param font: The font to take the glyphs from
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param str characters: The characters to put in the atlas
+    :param int value_count: Number of colors of the atlas bitmap
+    """
+    # pylint: disable=too-many-locals
+    if hasattr(font, "load_glyphs"):
+        font.load_glyphs(characters)
+    glyphs = []
+    code_points = set()
+    for char in characters:
+        glyph = font.get_glyph(ord(char))
+        if glyph is not None and ord(char) not in code_points:
+            code_points.add(ord(char))
+            glyphs.append((ord(char), glyph))
+    if not glyphs:
+        raise ValueError("The font has none of the characters")
+
+    # The cell is the box holding every glyph
+    left = min(glyph.dx for _, glyph in glyphs)
+    right = max(glyph.dx + glyph.width for _, glyph in glyphs)
+    bottom = min(glyph.dy for _, glyph in glyphs)
+    top = max(glyph.dy + glyph.height for _, glyph in glyphs)
+    cell_width = max(1, right - left)
+    cell_height = max(1, top - bottom)
+
+    bitmap = displayio.Bitmap(cell_width * len(glyphs), cell_height, value_count)
+    entries = []
+    for tile_index, (code_point, glyph) in enumerate(glyphs):
+        entries.append((code_point, glyph.shift_x))
+        target_x = tile_index * cell_width + glyph.dx - left
+        target_y = top - glyph.dy - glyph.height
+        source_x = glyph.tile_index * glyph.width
+        for y in range(glyph.height):
+            for x in range(glyph.width):
+                value = glyph.bitmap[source_x + x, y]
+                if value:
+                    bitmap[target_x + x, target_y + y] = value
+
+    if hasattr(font, "ascent") and hasattr(font, "descent"):
+        ascent, descent = font.ascent, font.descent
+    else:
+        ascent, descent = top, -bottom
+    return FontAtlas(
+        bitmap, cell_width, cell_height, left, bottom, entries, ascent, descent
+    )
+
+
+def load_atlas(path: str) -> FontAtlas:
+    """Read a `FontAtlas` written by `FontAtlas.save`.
+
+    :param str path: Name of the file to read
+    """
+    with open(path, "rb") as file:
+        header = file.read(struct.calcsize(_HEADER))
+        (
+            magic,
+            version,
+            width,
+            height,
+            dx,
+            dy,
+            ascent,
+            descent,
+            count,
+        ) = struct.unpack(_HEADER, header)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("{} isn't a font atlas file".format(path))
+
+        entry_size = struct.calcsize(_ENTRY)
+        data = file.read(entry_size * count)
+        entries = []
+        for index in range(count):
+            entries.append(struct.unpack_from(_ENTRY, data, index * entry_size))
+
+        bitmap = displayio.Bitmap(width * count, height, 2)
+        row = bytearray((bitmap.width + 7) // 8)
+        for y in range(height):
+            file.readinto(row)
+            for byte_index, byte in enumerate(row):
+                if not byte:
+                    continue
+                x = byte_index << 3
+                for bit in range(8):
+                    if byte & (0x80 >> bit):
+                        bitmap[x + bit, y] = 1
+    return FontAtlas(bitmap, width, height, dx, dy, entries, ascent, descent)
@@ -36,7 +36,7 @@ except ImportError:
 
 from displayio import Bitmap, Palette, TileGrid
 
-from adafruit_display_text import LabelBase
+from adafruit_display_text import LabelBase, glyph_cache
 
 
 class Label(LabelBase):
@@ -86,13 +86,16 @@ class Label(LabelBase):
     def __init__(self, font: Union[BuiltinFont, BDF, PCF], **kwargs) -> None:
         self._background_palette = Palette(1)
         self._added_background_tilegrid = False
+        # One (TileGrid, bitmap, tile width, tile height, direction) per glyph slot
+        # of the local group after the background, kept hidden when not needed
+        self._glyph_pool = []
 
         super().__init__(font, **kwargs)
 
         text = self._replace_tabs(self._text)
 
         self._width = len(text)
-        self._height = self._font.get_bounding_box()[1]
+        self._height = glyph_cache(self._font).bounding_box[1]
 
         # Create the two-color text palette
         self._palette[0] = 0
@@ -227,6 +230,101 @@ class Label(LabelBase):
                 self._local_group.pop(0)
                 self._added_background_tilegrid = False
 
+    def _place_glyph(self, index: int, glyph, x: int, y: int) -> None:
+        """Show ``glyph`` at ``x, y`` in glyph slot ``index`` of the local group.
+        The TileGrid already in the slot is moved and switched to the glyph's tile
+        when it shows the same bitmap with the same tile size, as all the glyphs of
+        a BuiltinFont do, otherwise a new one replaces it."""
+        if index < len(self._glyph_pool):
+            face, bitmap, width, height, direction = self._glyph_pool[index]
+            if (
+                bitmap is glyph.bitmap
+                and width == glyph.width
+                and height == glyph.height
+                and direction == self._label_direction
+            ):
+                face[0] = glyph.tile_index
+                face.x = x
+                face.y = y
+                face.hidden = False
+                return
+
+        face = TileGrid(
+            glyph.bitmap,
+            pixel_shader=self._palette,
+            default_tile=glyph.tile_index,
+            tile_width=glyph.width,
+            tile_height=glyph.height,
+            x=x,
+            y=y,
+        )
+
+        if self._label_direction == "UPR":
+            face.transpose_xy = True
+            face.flip_x = True
+        if self._label_direction == "DWR":
+            face.transpose_xy = True
+            face.flip_y = True
+
+        entry = (face, glyph.bitmap, glyph.width, glyph.height, self._label_direction)
+        slot = index + (1 if self._added_background_tilegrid else 0)
+        if index < len(self._glyph_pool):
+            self._local_group[slot] = face
+            self._glyph_pool[index] = entry
+        else:
+            self._local_group.append(face)
+            self._glyph_pool.append(entry)
+
+    def _update_monospace(
+        self, new_text: str, glyphs, tilegrid_count: int, glyph_offset: int
+    ) -> Tuple[int, int, int, int, int]:
+        # pylint: disable=too-many-locals
+
+        # Left to right text in a fixed width font. Every glyph has the metrics of
+        # the cell, so glyphs are placed by their count on the line and the
+        # bounding box follows from the line lengths alone.
+        cell = glyphs.monospace
+        shift_x = cell.shift_x
+        line_height = int(self._height * self._line_spacing)
+        position_y = -cell.height - cell.dy + self._y_offset
+
+        y = 0
+        x = 0
+        longest = 0
+        first_line = last_line = None  # y of the first and last lines holding glyphs
+        for character in new_text + "\n":
+            if character == "\n":
+                if x:
+                    if first_line is None:
+                        first_line = y
+                    last_line = y
+                    longest = max(longest, x)
+                y += line_height
+                x = 0
+                continue
+            glyph = glyphs.get_glyph(ord(character))
+            if not glyph:
+                continue
+            if glyph.width > 0 and glyph.height > 0:
+                self._place_glyph(
+                    tilegrid_count - glyph_offset,
+                    glyph,
+                    x + cell.dx,
+                    y + position_y,
+                )
+                tilegrid_count += 1
+            x += shift_x
+
+        if first_line is None:  # no glyphs
+            return tilegrid_count, 0, 0, 0, 0
+        right = max(longest, longest - shift_x + cell.width + cell.dx)
+        top = 0
+        if min(first_line, last_line) <= 0 <= max(first_line, last_line):
+            # a line at y == 0, all of them when line_spacing is 0
+            top = min(0, position_y)
+        bottom = max(0, max(first_line, last_line) - cell.dy + self._y_offset)
+        return tilegrid_count, cell.dx, top, right, bottom
+
     def _update_text(self, new_text: str) -> None:
         # pylint: disable=too-many-branches,too-many-statements
 
@@ -236,7 +334,7 @@ class Label(LabelBase):
             i = 1
         else:
             i = 0
-        tilegrid_count = i
+        tilegrid_count = glyph_offset = i
         if self._base_alignment:
             self._y_offset = 0
         else:
@@ -252,123 +350,115 @@ class Label(LabelBase):
             top = right = left = 0
             bottom = 0
 
-        for character in new_text:
-            if character == "\n":
-                y += int(self._height * self._line_spacing)
-                x = 0
-                continue
-            glyph = self._font.get_glyph(ord(character))
-            if not glyph:
-                continue
-
-            position_x, position_y = 0, 0
-
-            if self._label_direction in ("LTR", "RTL"):
-                bottom = max(bottom, y - glyph.dy + self._y_offset)
-                if y == 0:  # first line, find the Ascender height
-                    top = min(top, -glyph.height - glyph.dy + self._y_offset)
-                position_y = y - glyph.height - glyph.dy + self._y_offset
-
-                if self._label_direction == "LTR":
-                    right = max(right, x + glyph.shift_x, x + glyph.width + glyph.dx)
+        glyphs = glyph_cache(self._font)
+        if self._label_direction == "LTR" and glyphs.monospace is not None:
+            tilegrid_count, left, top, right, bottom = self._update_monospace(
+                new_text, glyphs, tilegrid_count, glyph_offset
+            )
+        else:
+            for character in new_text:
+                if character == "\n":
+                    y += int(self._height * self._line_spacing)
+                    x = 0
+                    continue
+                glyph = glyphs.get_glyph(ord(character))
+                if not glyph:
+                    continue
+
+                position_x, position_y = 0, 0
+
+                if self._label_direction in ("LTR", "RTL"):
+                    bottom = max(bottom, y - glyph.dy + self._y_offset)
+                    if y == 0:  # first line, find the Ascender height
+                        top = min(top, -glyph.height - glyph.dy + self._y_offset)
+                    position_y = y - glyph.height - glyph.dy + self._y_offset
+
+                    if self._label_direction == "LTR":
+                        right = max(
+                            right, x + glyph.shift_x, x + glyph.width + glyph.dx
+                        )
+                        if x == 0:
+                            if left is None:
+                                left = glyph.dx
+                            else:
+                                left = min(left, glyph.dx)
+                        position_x = x + glyph.dx
+                    else:
+                        left = max(
+                            left,
+                            abs(x) + glyph.shift_x,
+                            abs(x) + glyph.width + glyph.dx,
+                        )
+                        if x == 0:
+                            if right is None:
+                                right = glyph.dx
+                            else:
+                                right = max(right, glyph.dx)
+                        position_x = x - glyph.width
+
+                elif self._label_direction == "TTB":
                     if x == 0:
                         if left is None:
                             left = glyph.dx
                         else:
                             left = min(left, glyph.dx)
-                    position_x = x + glyph.dx
-                else:
-                    left = max(
-                        left, abs(x) + glyph.shift_x, abs(x) + glyph.width + glyph.dx
+                    if y == 0:
+                        top = min(top, -glyph.dy)
+
+                    bottom = max(bottom, y + glyph.height, y + glyph.height + glyph.dy)
+                    right = max(
+                        right, x + glyph.width + glyph.dx, x + glyph.shift_x + glyph.dx
                     )
+                    position_y = y + glyph.dy
+                    position_x = x - glyph.width // 2 + self._y_offset
+
+                elif self._label_direction == "UPR":
                     if x == 0:
-                        if right is None:
-                            right = glyph.dx
-                        else:
-                            right = max(right, glyph.dx)
-                    position_x = x - glyph.width
+                        if bottom is None:
+                            bottom = -glyph.dx
+
+                    if y == 0:  # first line, find the Ascender height
+                        bottom = min(bottom, -glyph.dy)
+                    left = min(left, x - glyph.height + self._y_offset)
+                    top = min(top, y - glyph.width - glyph.dx, y - glyph.shift_x)
+                    right = max(right, x + glyph.height, x + glyph.height - glyph.dy)
+                    position_y = y - glyph.width - glyph.dx
+                    position_x = x - glyph.height - glyph.dy + self._y_offset
+
+                elif self._label_direction == "DWR":
+                    if y == 0:
+                        if top is None:
+                            top = -glyph.dx
+                    top = min(top, -glyph.dx)
+                    if x == 0:
+                        left = min(left, -glyph.dy)
+                    left = min(left, x, x - glyph.dy - self._y_offset)
+                    bottom = max(bottom, y + glyph.width + glyph.dx, y + glyph.shift_x)
+                    right = max(right, x + glyph.height)
+                    position_y = y + glyph.dx
+                    position_x = x + glyph.dy - self._y_offset
+
+                if glyph.width > 0 and glyph.height > 0:
+                    self._place_glyph(
+                        tilegrid_count - glyph_offset, glyph, position_x, position_y
+                    )
+                    tilegrid_count += 1
 
-            elif self._label_direction == "TTB":
-                if x == 0:
-                    if left is None:
-                        left = glyph.dx
+                if self._label_direction == "RTL":
+                    x = x - glyph.shift_x
+                if self._label_direction == "TTB":
+                    if glyph.height < 2:
+                        y = y + glyph.shift_x
                     else:
-                        left = min(left, glyph.dx)
-                if y == 0:
-                    top = min(top, -glyph.dy)
-
-                bottom = max(bottom, y + glyph.height, y + glyph.height + glyph.dy)
-                right = max(
-                    right, x + glyph.width + glyph.dx, x + glyph.shift_x + glyph.dx
-                )
-                position_y = y + glyph.dy
-                position_x = x - glyph.width // 2 + self._y_offset
-
-            elif self._label_direction == "UPR":
-                if x == 0:
-                    if bottom is None:
-                        bottom = -glyph.dx
-
-                if y == 0:  # first line, find the Ascender height
-                    bottom = min(bottom, -glyph.dy)
-                left = min(left, x - glyph.height + self._y_offset)
-                top = min(top, y - glyph.width - glyph.dx, y - glyph.shift_x)
-                right = max(right, x + glyph.height, x + glyph.height - glyph.dy)
-                position_y = y - glyph.width - glyph.dx
-                position_x = x - glyph.height - glyph.dy + self._y_offset
-
-            elif self._label_direction == "DWR":
-                if y == 0:
-                    if top is None:
-                        top = -glyph.dx
-                top = min(top, -glyph.dx)
-                if x == 0:
-                    left = min(left, -glyph.dy)
-                left = min(left, x, x - glyph.dy - self._y_offset)
-                bottom = max(bottom, y + glyph.width + glyph.dx, y + glyph.shift_x)
-                right = max(right, x + glyph.height)
-                position_y = y + glyph.dx
-                position_x = x + glyph.dy - self._y_offset
-
-            if glyph.width > 0 and glyph.height > 0:
-                face = TileGrid(
-                    glyph.bitmap,
-                    pixel_shader=self._palette,
-                    default_tile=glyph.tile_index,
-                    tile_width=glyph.width,
-                    tile_height=glyph.height,
-                    x=position_x,
-                    y=position_y,
-                )
-
+                        y = y + glyph.height + 1
                 if self._label_direction == "UPR":
-                    face.transpose_xy = True
-                    face.flip_x = True
+                    y = y - glyph.shift_x
                 if self._label_direction == "DWR":
-                    face.transpose_xy = True
-                    face.flip_y = True
-
-                if tilegrid_count < len(self._local_group):
-                    self._local_group[tilegrid_count] = face
-                else:
-                    self._local_group.append(face)
-                tilegrid_count += 1
-
-            if self._label_direction == "RTL":
-                x = x - glyph.shift_x
-            if self._label_direction == "TTB":
-                if glyph.height < 2:
                     y = y + glyph.shift_x
-                else:
-                    y = y + glyph.height + 1
-            if self._label_direction == "UPR":
-                y = y - glyph.shift_x
-            if self._label_direction == "DWR":
-                y = y + glyph.shift_x
-            if self._label_direction == "LTR":
-                x = x + glyph.shift_x
+                if self._label_direction == "LTR":
+                    x = x + glyph.shift_x
 
-            i += 1
+                i += 1
 
         if self._label_direction == "LTR" and left is None:
             left = 0
@@ -377,8 +467,9 @@ class Label(LabelBase):
         if self._label_direction == "TTB" and top is None:
             top = 0
 
-        while len(self._local_group) > tilegrid_count:  # i:
-            self._local_group.pop()
+        # Hide the glyphs that are left over, they are reused by the next update
+        for index in range(tilegrid_count - glyph_offset, len(self._glyph_pool)):
+            self._glyph_pool[index][0].hidden = True
 
         if self._label_direction == "RTL":
             # pylint: disable=invalid-unary-operand-type
@@ -408,7 +499,7 @@ class Label(LabelBase):
         current_anchored_position = self.anchored_position
         self._text = ""
         self._font = new_font
-        self._height = self._font.get_bounding_box()[1]
+        self._height = glyph_cache(self._font).bounding_box[1]
         self._update_text(str(old_text))
         self.anchored_position = current_anchored_position
 
@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.numeric_label`
+================================================================================
+
+A label for numbers that change often, showing a fixed row of digit tiles
+
+
+* Author(s): Eric Ayers
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+
+try:
+    from typing import Union, Optional, Tuple
+    from fontio import BuiltinFont
+    from adafruit_bitmap_font.bdf import BDF
+    from adafruit_bitmap_font.pcf import PCF
+except ImportError:
+    pass
+
+import displayio
+
+from adafruit_display_text import LabelBase, glyph_cache
+
+DIGITS = "0123456789.-+ "
+"""The characters a `NumericLabel` shows by default"""
+
+
+class DigitSheet:
+    """The glyphs of ``characters`` as equally sized tiles of one bitmap, shared
+    by the `NumericLabel` instances using the same font. Get the sheet of a font
+    with `digit_sheet`.
+
+    The tiles of a fixed width font like ``terminalio.FONT`` already are in the
+    font's bitmap and are used as they are. For other fonts the glyphs are
+    rendered once into cells as wide as the widest glyph.
+
+    :param font: The font to take the glyphs from
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param str characters: The characters to make tiles of, including a space
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, font: Union[BuiltinFont, BDF, PCF], characters: str) -> None:
+        glyphs = glyph_cache(font)
+        found = []
+        for char in characters:
+            glyph = glyphs.get_glyph(ord(char))
+            if glyph is None and char != " ":
+                raise ValueError("Font has no glyph for {}".format(repr(char)))
+            found.append(glyph)
+
+        cell = glyphs.monospace
+        if cell is not None and cell.width == cell.shift_x and None not in found:
+            # Use the font's own tiles
+            self.bitmap = cell.bitmap
+            self.tile_width = cell.width
+            self.tile_height = cell.height
+            self.x = cell.dx
+            self.y = -cell.height - cell.dy
+            self._tiles = {}
+            for char, glyph in zip(characters, found):
+                self._tiles[char] = glyph.tile_index
+            return
+
+        # Render the glyphs into equal cells
+        left = ascent = descent = 0
+        right = 1
+        for glyph in found:
+            if glyph is not None:
+                left = min(left, glyph.dx)
+                right = max(right, glyph.shift_x, glyph.dx + glyph.width)
+                ascent = max(ascent, glyph.height + glyph.dy)
+                descent = max(descent, -glyph.dy)
+        self.tile_width = right - left
+        self.tile_height = max(1, ascent + descent)
+        self.x = left
+        self.y = -ascent
+        self.bitmap = displayio.Bitmap(
+            self.tile_width * len(characters), self.tile_height, 2
+        )
+        self._tiles = {}
+        for index, (char, glyph) in enumerate(zip(characters, found)):
+            self._tiles[char] = index
+            if glyph is not None:
+                self._draw(
+                    glyph,
+                    index * self.tile_width + glyph.dx - left,
+                    ascent - glyph.height - glyph.dy,
+                )
+
+    def _draw(self, glyph, x: int, y: int) -> None:
+        source_x = glyph.tile_index * glyph.width
+        for glyph_y in range(glyph.height):
+            for glyph_x in range(glyph.width):
+                if glyph.bitmap[source_x + glyph_x, glyph_y]:
+                    self.bitmap[x + glyph_x, y + glyph_y] = 1
+
+    def __contains__(self, char: str) -> bool:
+        return char in self._tiles
+
+    def tile(self, char: str) -> int:
+        """Tile index of ``char``"""
+        if char not in self._tiles:
+            raise ValueError(
+                "{} isn't one of the characters of the sheet".format(repr(char))
+            )
+        return self._tiles[char]
+
+
+_digit_sheets = {}
+
+
+def digit_sheet(
+    font: Union[BuiltinFont, BDF, PCF], characters: str = DIGITS
+) -> DigitSheet:
+    """The `DigitSheet` of ``characters`` in ``font``, created on first use.
+
+    :param font: The font to get the sheet for
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param str characters: The characters of the sheet
+    """
+    key = (font, characters)
+    sheet = _digit_sheets.get(key)
+    if sheet is None:
+        sheet = _digit_sheets[key] = DigitSheet(font, characters)
+    return sheet
+
+
+class NumericLabel(LabelBase):
+    """A label showing a number, or any text of the sheet's characters, right
+    aligned in a fixed row of ``digits`` character cells.
+
+    The cells are the tiles of a single TileGrid over the font's `DigitSheet`,
+    shared by all the numeric labels using the font. Updating the value only
+    sets the tile indices of the cells that changed, nothing is laid out or
+    rendered. Values too long for the cells, or with characters the sheet lacks
+    like the ``e`` of ``1e-05``, show as a row of ``-``.
+
+    Typical use::
+
+        temperature = NumericLabel(terminalio.FONT, 5, decimals=1, x=10, y=10)
+        while True:
+            temperature.value = sensor.temperature
+
+    :param font: A font class that has ``get_bounding_box`` and ``get_glyph``.
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param int digits: Number of character cells
+    :param int decimals: Digits shown after the decimal point, `None` to show
+     values as `str` does
+    :param str characters: The characters the label can show. Defaults to `DIGITS`.
+    :param value: The number to show first, `None` for nothing
+
+    The other parameters are the ones of `LabelBase`. ``text`` can be used
+    instead of ``value``, and the only ``label_direction`` is ``LTR``."""
+
+    def __init__(
+        self,
+        font: Union[BuiltinFont, BDF, PCF],
+        digits: int,
+        decimals: Optional[int] = None,
+        characters: str = DIGITS,
+        value: Optional[Union[int, float]] = None,
+        **kwargs
+    ) -> None:
+        if digits <= 0:
+            raise ValueError("digits must be greater than 0")
+        if kwargs.get("label_direction", "LTR") != "LTR":
+            raise ValueError("NumericLabel only supports LTR text")
+        if " " not in characters:
+            characters += " "
+        self._digits = digits
+        self._characters = characters
+        if decimals is None:
+            self._format = None
+        else:
+            self._format = "{:." + str(decimals) + "f}"
+        self._value = None
+        self._sheet = None
+        self._grid = None
+        self._cells = None
+
+        super().__init__(font, **kwargs)
+
+        self._build()
+        if value is not None:
+            self.value = value
+        else:
+            self._set_text(self._text, self.scale)
+        self.anchored_position = self._anchored_position
+
+    def _build(self) -> None:
+        # Create the TileGrid over the sheet of the font, all cells blank
+        self._sheet = sheet = digit_sheet(self._font, self._characters)
+        blank = sheet.tile(" ")
+        self._grid = displayio.TileGrid(
+            sheet.bitmap,
+            pixel_shader=self._palette,
+            width=self._digits,
+            height=1,
+            tile_width=sheet.tile_width,
+            tile_height=sheet.tile_height,
+            default_tile=blank,
+            x=sheet.x,
+            y=self._y_offset + sheet.y,
+        )
+        self._cells = [blank] * self._digits
+        while len(self._local_group):
+            self._local_group.pop()
+        self._local_group.append(self._grid)
+        self._bounding_box = (
+            self._grid.x,
+            self._grid.y,
+            self._digits * sheet.tile_width,
+            sheet.tile_height,
+        )
+        self.anchored_position = self._anchored_position
+
+    @property
+    def digits(self) -> int:
+        """Number of character cells"""
+        return self._digits
+
+    @property
+    def value(self) -> Optional[Union[int, float]]:
+        """The number shown, `None` when showing nothing or text"""
+        return self._value
+
+    @value.setter
+    def value(self, new_value: Optional[Union[int, float]]) -> None:
+        if new_value is None:
+            text = ""
+        elif self._format is None:
+            text = str(new_value)
+        else:
+            text = self._format.format(new_value)
+        self._set_text(text, self.scale)
+        self._value = new_value
+
+    def _set_text(self, new_text: str, scale: int) -> None:
+        sheet = self._sheet
+        text = str(new_text)
+        # Check the whole text before any cell is written
+        if len(text) > self._digits or not all(char in sheet for char in text):
+            text = ("-" if "-" in sheet else " ") * self._digits
+        self._text = text
+        self._value = None
+
+        # Only the cells that change are written
+        grid = self._grid
+        cells = self._cells
+        start = self._digits - len(text)
+        blank = sheet.tile(" ")
+        for index in range(self._digits):
+            if index < start:
+                tile = blank
+            else:
+                tile = sheet.tile(text[index - start])
+            if cells[index] != tile:
+                grid[index] = tile
+                cells[index] = tile
+
+    def _set_font(self, new_font: Union[BuiltinFont, BDF, PCF]) -> None:
+        self._font = new_font
+        self._ascent, self._descent = self._get_ascent_descent()
+        if not self._base_alignment:
+            self._y_offset = self._ascent // 2
+        value = self._value
+        self._build()
+        self._set_text(self._text, self.scale)
+        self._value = value
+        self.anchored_position = self._anchored_position
+
+    def _set_line_spacing(self, new_line_spacing: float) -> None:
+        self._line_spacing = new_line_spacing  # a single line, nothing to do
+
+    def _set_background_color(self, new_color: Optional[int]) -> None:
+        self._background_color = new_color
+        if new_color is not None:
+            self._palette[0] = new_color
+            self._palette.make_opaque(0)
+        else:
+            self._palette[0] = 0
+            self._palette.make_transparent(0)
+
+    def _set_label_direction(self, new_label_direction: str) -> None:
+        self._label_direction = new_label_direction
+
+    def _get_valid_label_directions(self) -> Tuple[str, ...]:
+        return ("LTR",)
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.scrolling_label`
+================================================================================
+
+A bitmap label showing a window of its text that scrolls like a marquee
+
+
+* Author(s): Eric Ayers
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+
+try:
+    from typing import Union, Optional, Tuple
+    from fontio import BuiltinFont
+    from adafruit_bitmap_font.bdf import BDF
+    from adafruit_bitmap_font.pcf import PCF
+except ImportError:
+    pass
+
+import displayio
+
+from adafruit_display_text.bitmap_label import Label
+
+
+class ScrollingLabel(Label):
+    """A `bitmap_label.Label` that shows a ``viewport_width`` pixel wide window
+    of its text and scrolls the text through it like a marquee.
+
+    The whole text is rendered once into the bitmap. The window is a TileGrid
+    with a one pixel wide tile per column, showing columns of the bitmap.
+    Scrolling only changes which columns the tiles show, the text isn't laid out
+    or rendered again until it changes. Text that fits in the window doesn't
+    scroll.
+
+    Typical use::
+
+        ticker = ScrollingLabel(terminalio.FONT, 100, text=long_text, x=8, y=8)
+        while True:
+            ticker.scroll()
+            time.sleep(0.05)
+
+    :param font: A font class that has ``get_bounding_box`` and ``get_glyph``.
+    :type font: ~BuiltinFont, ~BDF, or ~PCF
+    :param int viewport_width: Width of the window in pixels, before scaling
+    :param bool wrap: When `True` the start of the text follows its end after
+     ``gap`` pixels, when `False` scrolling stops once the end of the text is
+     at the right edge of the window
+    :param int gap: Blank pixels between the end of the text and its start when
+     wrapping. Defaults to the width of two characters of the font.
+
+    The other parameters are the ones of `bitmap_label.Label`, except that the
+    only ``label_direction`` is ``LTR`` and ``max_size`` can't be set."""
+
+    def __init__(
+        self,
+        font: Union[BuiltinFont, BDF, PCF],
+        viewport_width: int,
+        wrap: bool = True,
+        gap: Optional[int] = None,
+        **kwargs
+    ) -> None:
+        if kwargs.get("label_direction", "LTR") != "LTR":
+            raise ValueError("ScrollingLabel only supports LTR text")
+        if kwargs.get("max_size") is not None:
+            raise ValueError("ScrollingLabel sizes its own bitmap")
+        if viewport_width <= 0:
+            raise ValueError("viewport_width must be greater than 0")
+
+        self._viewport_width = viewport_width
+        self._wrap = wrap
+        self._gap = gap if gap is not None else 2 * font.get_bounding_box()[0]
+        self._viewport = None
+        self._viewport_bitmap = None
+        self._offset = 0
+        self._period = 0  # columns of one scroll cycle, 0 when not scrolling
+
+        super().__init__(font, **kwargs)
+
+    @property
+    def viewport_width(self) -> int:
+        """Width of the window in pixels, before scaling"""
+        return self._viewport_width
+
+    @property
+    def scrolling(self) -> bool:
+        """`True` when the text is wider than the window and scrolls"""
+        return self._period > 0
+
+    @property
+    def offset(self) -> int:
+        """Pixel column of the text at the left edge of the window"""
+        return self._offset
+
+    @offset.setter
+    def offset(self, new_offset: int) -> None:
+        self._set_offset(new_offset)
+
+    def scroll(self, pixels: int = 1) -> bool:
+        """Move the text ``pixels`` to the left through the window, to the right
+        for negative values. Only the tile indices of the window change.
+
+        :return: `True` if the text moved, `False` if it doesn't scroll or
+         already reached the end without ``wrap``
+        :rtype: bool
+        """
+        old_offset = self._offset
+        self._set_offset(self._offset + pixels)
+        return self._offset != old_offset
+
+    def _set_offset(self, new_offset: int) -> None:
+        if not self._period:
+            self._offset = 0
+            return
+        new_offset = self._limit_offset(new_offset)
+        if new_offset != self._offset:
+            self._offset = new_offset
+            self._show_offset()
+
+    def _limit_offset(self, offset: int) -> int:
+        if self._wrap:
+            return offset % self._period
+        return max(0, min(offset, self._period - self._viewport_width))
+
+    def _show_offset(self) -> None:
+        # Point the tiles of the window at the columns from the offset on. Past
+        # the end of the text the columns of the gap follow, then the text again.
+        viewport = self._viewport
+        period = self._period
+        column = self._offset
+        for index in range(self._viewport_width):
+            viewport[index] = column
+            column += 1
+            if column == period:
+                column = 0
+
+    def _bitmap_size(self, width: int, height: int) -> Tuple[int, int]:
+        # Blank columns after the text for the gap
+        if self._wrap and width > self._viewport_width:
+            return width + self._gap, height
+        return width, height
+
+    def _reset_text(
+        self,
+        font: Optional[Union[BuiltinFont, BDF, PCF]] = None,
+        text: Optional[str] = None,
+        line_spacing: Optional[float] = None,
+        scale: Optional[int] = None,
+    ) -> None:
+        super()._reset_text(
+            font=font, text=text, line_spacing=line_spacing, scale=scale
+        )
+
+        text_width = self._drawn_size[0]
+        if len(self._local_group) == 0 or text_width <= self._viewport_width:
+            # The label shows all of the text
+            self._period = 0
+            self._offset = 0
+            return
+
+        if self._wrap:
+            self._period = text_width + self._gap
+        else:
+            self._period = text_width
+
+        if self._viewport is None or self._viewport_bitmap is not self._bitmap:
+            self._viewport = displayio.TileGrid(
+                self._bitmap,
+                pixel_shader=self._palette,
+                width=self._viewport_width,
+                height=1,
+                tile_width=1,
+                tile_height=self._bitmap.height,
+            )
+            self._viewport_bitmap = self._bitmap
+        self._viewport.x = self._tilegrid.x
+        self._viewport.y = self._tilegrid.y
+        self._local_group[0] = self._viewport
+
+        # Keep scrolling from where the text was, within the new text
+        self._offset = self._limit_offset(self._offset)
+        self._show_offset()
+
+        self._bounding_box = (
+            self._bounding_box[0],
+            self._bounding_box[1],
+            self._viewport_width,
+            self._bounding_box[3],
+        )
+        self.anchored_position = self._anchored_position
+
+    def _get_valid_label_directions(self) -> Tuple[str, ...]:
+        return ("LTR",)
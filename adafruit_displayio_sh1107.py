@@ -79,6 +79,27 @@ The hardware display offset to use when configuring the SH1107 for the
         display_offset=DISPLAY_OFFSET_PIMORONI_MONO_OLED_PIM374)
 """
 
+PANEL_PROFILES = {
+    "adafruit_featherwing_oled_4650": (
+        DISPLAY_OFFSET_ADAFRUIT_FEATHERWING_OLED_4650,
+        128,
+        64,
+    ),
+    "adafruit_128x128_oled_5297": (DISPLAY_OFFSET_ADAFRUIT_128x128_OLED_5297, 128, 128),
+    "pimoroni_mono_oled_pim374": (DISPLAY_OFFSET_PIMORONI_MONO_OLED_PIM374, 128, 128),
+}
+"""
+Named panel profiles mapping to ``(display_offset, width, height)``. Pass the name
+as ``profile`` instead of the individual values. Add entries for other panels.
+
+.. code-block::
+
+    from adafruit_displayio_sh1107 import SH1107
+
+    # Constructor for the Pimoroni Mono 128x128 OLED
+    display = SH1107(bus, profile="pimoroni_mono_oled_pim374")
+"""
+
 
 # Sequence from sh1107 framebuf driver formatted for displayio init
 # we fixed sh110x addressing in 7, so we have slightly different setups
@@ -124,6 +145,102 @@ else:
     _PIXELS_IN_ROW = False
     _ROTATION_OFFSET = 90
 
+NATIVE_ROTATION = (360 - _ROTATION_OFFSET) % 360
+"""
+The ``rotation`` at which the panel runs in its native orientation and displayio
+doesn't transform the pixel coordinates on refresh. Combine with assets rotated by
+`panel_rotation` once, see ``asset_rotation``.
+
+.. code-block::
+
+    from adafruit_displayio_sh1107 import SH1107, NATIVE_ROTATION, panel_rotation
+
+    # Laid out for rotation=270, but rotated once up front instead of every refresh
+    display = SH1107(bus, width=128, height=128, rotation=NATIVE_ROTATION)
+    logo = asset_rotation.rotate_bitmap(logo_bitmap, panel_rotation(270))
+"""
+
+
+def panel_rotation(rotation):
+    """
+    The transform displayio applies to every pixel for a display constructed with
+    ``rotation``. Assets rotated by this are shown the same way on a display running
+    at `NATIVE_ROTATION`.
+
+    :param int rotation: The rotation the screen is laid out for. 0, 90, 180 or 270
+    :rtype: int
+    """
+    return (rotation + _ROTATION_OFFSET) % 360
+
+
+# Sent instead of _INIT_SEQUENCE when the panel is already initialized and sleeping.
+# Only the registers that depend on the constructor arguments are rewritten, the
+# rest of the controller state and the display RAM survive sleep mode.
+_WARM_INIT_SEQUENCE = (
+    b"\xa8\x01\x7f"  # multiplex ratio, patched per display
+    b"\xd3\x01\x60"  # set display offset, patched per display
+    b"\xaf\x00"  # DISPLAY_ON, display RAM is left untouched
+)
+
+# Where the multiplex ratio and display offset values sit in each sequence
+_INIT_PATCH_INDEXES = (
+    _INIT_SEQUENCE.index(b"\xa8\x01") + 2,
+    _INIT_SEQUENCE.index(b"\xd3\x01") + 2,
+)
+_WARM_INIT_PATCH_INDEXES = (
+    _WARM_INIT_SEQUENCE.index(b"\xa8\x01") + 2,
+    _WARM_INIT_SEQUENCE.index(b"\xd3\x01") + 2,
+)
+
+# Bus bytes spent addressing each page of a RAM write: the page, upper column and
+# lower column commands. An I2C bus frames every command byte of a send as its own
+# transaction (address, 0x80 control byte, command), and the data that follows
+# needs a transaction of its own (address, 0x40 control byte).
+_PAGE_OVERHEAD = 3
+_I2C_PAGE_OVERHEAD = 3 * 3 + 2
+
+# Patched init sequences by (multiplex, display_offset, warm_start), built on first
+# use so constructing the same display again doesn't build them again
+_init_sequences = {}
+
+
+def _init_sequence(multiplex, display_offset, warm_start):
+    key = (multiplex, display_offset, warm_start)
+    sequence = _init_sequences.get(key)
+    if sequence is None:
+        if warm_start:
+            sequence = bytearray(_WARM_INIT_SEQUENCE)
+            multiplex_index, offset_index = _WARM_INIT_PATCH_INDEXES
+        else:
+            sequence = bytearray(_INIT_SEQUENCE)
+            multiplex_index, offset_index = _INIT_PATCH_INDEXES
+        sequence[multiplex_index] = multiplex
+        sequence[offset_index] = display_offset
+        sequence = bytes(sequence)
+        _init_sequences[key] = sequence
+    return sequence
+
+
+def woke_from_deep_sleep():
+    """
+    Best guess whether the panel was left initialized and sleeping by a previous run.
+
+    Returns `True` when the board just woke from an ``alarm`` deep sleep, which is
+    how duty-cycled devices come back up. Use it to pick ``warm_start``:
+
+    .. code-block::
+
+        display = SH1107(bus, width=128, height=128,
+            warm_start=adafruit_displayio_sh1107.woke_from_deep_sleep())
+
+    :rtype: bool
+    """
+    try:
+        import alarm  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    return alarm.wake_alarm is not None
+
 
 class SH1107(displayio.Display):
     """
@@ -135,28 +252,53 @@ class SH1107(displayio.Display):
     :param int rotation: The rotation of the display. 0, 90, 180 or 270.
     :param int display_offset: The display offset that the first column is wired to.
         This will be dependent on the OLED display and two displays with the
-        same dimensions could have different offsets. This defaults to
-        `DISPLAY_OFFSET_ADAFRUIT_FEATHERWING_OLED_4650`
+        same dimensions could have different offsets. This defaults to the
+        ``profile`` value, or `DISPLAY_OFFSET_ADAFRUIT_FEATHERWING_OLED_4650`
+    :param str profile: Name of an entry in `PANEL_PROFILES` providing the defaults
+        for ``display_offset``, ``width`` and ``height``
+    :param bool warm_start: Trust that the panel is already initialized and sleeping
+        with its RAM intact (e.g. `sleep` was called before a deep sleep). Only the
+        wake command and the size dependent registers are sent instead of the full
+        init sequence, and ``auto_refresh`` defaults to `False` so the retained
+        image stays on the panel until the first explicit ``refresh()``.
+    :param i2c: The `busio.I2C` behind a ``displayio.I2CDisplay`` bus. Needed by
+        `write_page` and `write_window` on I2C, as an I2C display bus sends all the
+        bytes it is given as commands, not as display RAM data.
+    :param int i2c_address: The I2C address of the display, with ``i2c``
     """
 
     def __init__(
         self,
         bus,
-        display_offset=DISPLAY_OFFSET_ADAFRUIT_FEATHERWING_OLED_4650,
+        display_offset=None,
         rotation=0,
+        warm_start=False,
+        profile=None,
+        i2c=None,
+        i2c_address=None,
         **kwargs
     ):
-        rotation = (rotation + _ROTATION_OFFSET) % 360
+        if i2c is not None and i2c_address is None:
+            raise ValueError("i2c_address is needed with i2c")
+        if profile is not None:
+            profile_offset, width, height = PANEL_PROFILES[profile]
+            if display_offset is None:
+                display_offset = profile_offset
+            kwargs.setdefault("width", width)
+            kwargs.setdefault("height", height)
+        if display_offset is None:
+            display_offset = DISPLAY_OFFSET_ADAFRUIT_FEATHERWING_OLED_4650
+        rotation = panel_rotation(rotation)
         if rotation in (0, 180):
             multiplex = kwargs["width"] - 1
         else:
             multiplex = kwargs["height"] - 1
-        init_sequence = bytearray(_INIT_SEQUENCE)
-        init_sequence[16] = multiplex
-        init_sequence[19] = display_offset
+        if warm_start:
+            # Don't let displayio paint its terminal over the retained image
+            kwargs.setdefault("auto_refresh", False)
         super().__init__(
             bus,
-            init_sequence,
+            _init_sequence(multiplex, display_offset, warm_start),
             **kwargs,
             color_depth=1,
             grayscale=True,
@@ -171,7 +313,34 @@ class SH1107(displayio.Display):
             #                set page address     = 0xB0 - 0xBF (16 pages)
             SH1107_addressing=True,
         )
-        self._is_awake = True  # Display starts in active state (_INIT_SEQUENCE)
+        # Display starts in active state (_INIT_SEQUENCE or _WARM_INIT_SEQUENCE)
+        self._is_awake = True
+        self._warm_started = warm_start
+        # Display RAM data can't go through the send() of an I2C display bus
+        self._on_i2c = i2c is not None or "I2C" in type(bus).__name__
+        self._i2c = i2c
+        self._i2c_address = i2c_address
+        self._data_buffer = None
+
+    @property
+    def page_overhead(self):
+        """
+        Bytes sent on the bus to address each page of a display RAM write, on
+        top of the pixel data. (read-only)
+
+        :type: int
+        """
+        return _I2C_PAGE_OVERHEAD if self._on_i2c else _PAGE_OVERHEAD
+
+    @property
+    def warm_started(self):
+        """
+        `True` if the display was constructed with ``warm_start`` and the panel
+        RAM was expected to still hold the previous image. (read-only)
+
+        :type: bool
+        """
+        return self._warm_started
 
     @property
     def is_awake(self):
@@ -184,6 +353,131 @@ class SH1107(displayio.Display):
         """
         return self._is_awake
 
+    def _native_window(self, x, y, width, height):
+        """
+        Map a rectangle in displayio coordinates onto the panel and return it as
+        ``(column, page, columns, pages)`` in display RAM addressing.
+        """
+        rotation = self.rotation
+        if rotation in (0, 180):
+            native_width, native_height = self.width, self.height
+        else:
+            native_width, native_height = self.height, self.width
+        # Same transform displayio applies to the frame for each rotation
+        if rotation == 0:
+            left, top, columns, rows = x, y, width, height
+        elif rotation == 90:
+            left, top, columns, rows = native_width - y - height, x, height, width
+        elif rotation == 180:
+            left, top = native_width - x - width, native_height - y - height
+            columns, rows = width, height
+        else:
+            left, top, columns, rows = y, native_height - x - width, height, width
+        if (
+            x < 0
+            or y < 0
+            or left < 0
+            or top < 0
+            or left + columns > native_width
+            or top + rows > native_height
+        ):
+            raise ValueError("Window outside of the display")
+        if _PIXELS_IN_ROW:
+            # pre CircuitPython 7 layout, the pages run across the native columns
+            left, top, columns, rows = top, left, rows, columns
+        if top % 8 or rows % 8:
+            raise ValueError("Window must be aligned to 8 pixel pages")
+        return left, top // 8, columns, rows // 8
+
+    def write_page(self, page, column, data):
+        """
+        Write ``data`` into display RAM at ``page`` starting at ``column``, in
+        the controller's own addressing. See `window_pages`.
+
+        :param int page: Display RAM page, 0 - 15
+        :param int column: First display RAM column, 0 - 127
+        :param data: The bytes to write, one per column
+        """
+        if self._on_i2c and self._i2c is None:
+            raise RuntimeError("Writing display RAM over I2C needs the i2c argument")
+        # set page address = 0xB0 - 0xBF, upper column = 0x10 - 0x17, lower column
+        # = 0x00 - 0x0F, the data following the last command goes into display RAM
+        self.bus.send(0xB0 | page, b"")
+        self.bus.send(0x10 | (column >> 4), b"")
+        if not self._on_i2c:
+            # FourWire and ParallelBus send the data with D/C high, as RAM data
+            self.bus.send(column & 0x0F, data)
+            return
+        self.bus.send(column & 0x0F, b"")
+        self._write_i2c_data(data)
+
+    def _write_i2c_data(self, data):
+        # One transaction with the 0x40 control byte, all following bytes are
+        # display RAM data
+        count = len(data)
+        if self._data_buffer is None or len(self._data_buffer) <= count:
+            self._data_buffer = bytearray(max(count, 128) + 1)
+            self._data_buffer[0] = 0x40
+        buffer = self._data_buffer
+        buffer[1 : count + 1] = data
+        i2c = self._i2c
+        while not i2c.try_lock():
+            pass
+        try:
+            i2c.writeto(self._i2c_address, buffer, end=count + 1)
+        finally:
+            i2c.unlock()
+
+    def window_pages(self, x, y, width, height, buffer, stride=None):
+        """
+        Split a `write_window` into its per page transfers without sending
+        anything. Yields ``(page, column, data)`` tuples for `write_page`, with
+        ``data`` being a `memoryview` into ``buffer``. Useful to interleave the
+        writes with other traffic on the bus.
+        """
+        column, page, columns, pages = self._native_window(x, y, width, height)
+        if stride is None:
+            stride = columns
+        data = memoryview(buffer)
+        if len(data) < (pages - 1) * stride + columns:
+            raise ValueError("Buffer too small for window")
+        for i in range(pages):
+            yield page + i, column, data[i * stride : i * stride + columns]
+
+    def write_window(self, x, y, width, height, buffer, stride=None):
+        """
+        Write 1bpp data for a rectangle straight into the display RAM, bypassing
+        the displayio compose and refresh. Only the bytes covering the window are
+        sent over the bus, which makes it cheap enough for a clock digit or a
+        status icon updated at a high rate.
+
+        The rectangle uses the same rotated coordinates as displayio. Once mapped
+        onto the panel it must start and end on 8 pixel page boundaries.
+        ``display_offset`` is applied by the controller itself, so no adjustment
+        is needed.
+
+        ``buffer`` holds the data in the panel's own layout: one run of bytes per
+        page, one byte per column, bit 0 being the first pixel of the page.
+        ``stride`` is the distance in bytes between two pages in ``buffer`` and
+        defaults to the window's width in columns.
+
+        displayio does not know about these writes, a refresh covering the same
+        area draws over them. On an I2C bus the display must have been constructed
+        with ``i2c`` and ``i2c_address``.
+
+        :param int x: Left edge of the window
+        :param int y: Top edge of the window
+        :param int width: Width of the window
+        :param int height: Height of the window
+        :param buffer: Page packed pixel data, any object supporting the buffer protocol
+        :param int stride: Bytes from the start of one page to the next in ``buffer``
+        """
+        # Validate everything before the first byte goes out
+        for page, column, data in list(
+            self.window_pages(x, y, width, height, buffer, stride)
+        ):
+            self.write_page(page, column, data)
+
     def sleep(self):
         """
         Put display into sleep mode. The display uses < 5uA in sleep mode
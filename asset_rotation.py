@@ -0,0 +1,73 @@
+# asset_rotation - turns images into the panel's native orientation up front
+#
+# A display constructed with a rotation makes displayio transform the coordinates
+# of every pixel on every refresh. Running the SH1107 at its native rotation
+# (adafruit_displayio_sh1107.NATIVE_ROTATION) and rotating the assets once when
+# they are loaded gives the same picture without the per refresh cost.
+#
+# The rotations match the transform displayio applies, so for a screen laid out for
+# rotation=270 use panel_rotation(270) as the rotation here:
+#
+#   rotation = adafruit_displayio_sh1107.panel_rotation(270)
+#   display = SH1107(bus, width=128, height=128,
+#       rotation=adafruit_displayio_sh1107.NATIVE_ROTATION)
+#   logo = rotate_bitmap(logo_bitmap, rotation)
+#   x, y, _, _ = rotate_rect(10, 20, logo_bitmap.width, logo_bitmap.height,
+#       rotation, 128, 128)
+import displayio
+
+
+def rotate_point(x, y, rotation, width, height):
+    """
+    Where pixel ``x, y`` of a ``width`` x ``height`` area laid out for
+    ``rotation`` lands in the native orientation. Returns ``(x, y)``.
+    """
+    if rotation == 0:
+        return x, y
+    if rotation == 90:
+        return height - 1 - y, x
+    if rotation == 180:
+        return width - 1 - x, height - 1 - y
+    if rotation == 270:
+        return y, width - 1 - x
+    raise ValueError("rotation must be 0, 90, 180 or 270")
+
+
+def rotate_rect(x, y, width, height, rotation, display_width, display_height):
+    """
+    Where a ``width`` x ``height`` rectangle at ``x, y`` of a display laid out for
+    ``rotation`` lands in the native orientation. ``display_width`` and
+    ``display_height`` are the size of the display as laid out. Returns
+    ``(x, y, width, height)``.
+    """
+    if rotation == 0:
+        return x, y, width, height
+    if rotation == 90:
+        return display_height - y - height, x, height, width
+    if rotation == 180:
+        return display_width - x - width, display_height - y - height, width, height
+    if rotation == 270:
+        return y, display_width - x - width, height, width
+    raise ValueError("rotation must be 0, 90, 180 or 270")
+
+
+def rotate_bitmap(bitmap, rotation, value_count=2):
+    """
+    A copy of ``bitmap`` in the native orientation for a layout made for
+    ``rotation``. This is the one time cost that saves displayio from rotating
+    the pixels on every refresh.
+
+    :param displayio.Bitmap bitmap: The bitmap as laid out
+    :param int rotation: 0, 90, 180 or 270
+    :param int value_count: Number of palette entries for the new bitmap
+    :rtype: displayio.Bitmap
+    """
+    width, height = bitmap.width, bitmap.height
+    if rotation in (90, 270):
+        rotated = displayio.Bitmap(height, width, value_count)
+    else:
+        rotated = displayio.Bitmap(width, height, value_count)
+    for y in range(height):
+        for x in range(width):
+            rotated[rotate_point(x, y, rotation, width, height)] = bitmap[x, y]
+    return rotated
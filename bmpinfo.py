@@ -8,6 +8,8 @@
 # import bmpinfo as bi; fh = open("drew_logo.bmp", "rb") ; bmp = bi.bmpinfo(fh) ; bmp.debug_info()
 import displayio
 
+import asset_rotation
+
 
 class BMPInfoException(Exception):
     pass
@@ -248,9 +250,23 @@ class bmpinfo:
     def bits_per_pixel(self):
         return self._bits_per_pixel
 
-    def bitmap(self):
-        bitmap = displayio.Bitmap(self._width, abs(self._height), 1)
-        for y in range(0, abs(self._height)):
-            for x in range(0, self._width):
-                bitmap[x, y] = int(self._bitmap_data[y][x])
+    def bitmap(self, rotation=0):
+        """
+        Create a displayio Bitmap from the image data.
+
+        rotation - 0, 90, 180 or 270. Stores the image already turned the way
+            displayio would turn it for that rotation, for displays running at their
+            native rotation. See asset_rotation.
+        """
+        width = self._width
+        height = abs(self._height)
+        if rotation in (90, 270):
+            bitmap = displayio.Bitmap(height, width, 1)
+        else:
+            bitmap = displayio.Bitmap(width, height, 1)
+        for y in range(0, height):
+            for x in range(0, width):
+                bitmap[asset_rotation.rotate_point(x, y, rotation, width, height)] = int(
+                    self._bitmap_data[y][x]
+                )
         return bitmap
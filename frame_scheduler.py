@@ -0,0 +1,114 @@
+# frame_scheduler - paces the refreshes of a displayio display such as the SH1107
+#
+# With auto_refresh on, displayio pushes frames whenever it decides to, including
+# half built scenes. The scheduler turns auto_refresh off, lets the application
+# build the next scene and commits it with one refresh() per frame period.
+#
+# Typical use:
+#
+#   scheduler = FrameScheduler(display, fps=10)
+#   scheduler.show(group)
+#   while True:
+#       if update_scene(group):  # change labels, tiles, ...
+#           scheduler.invalidate()
+#       scheduler.commit()
+import time
+
+
+class FrameScheduler:
+    """
+    Commits displayio scenes to a display at a target frame rate.
+
+    The group handed to the display is only ever sent to the panel by `commit`,
+    so it acts as the back buffer while the panel RAM holds the front buffer.
+    Frames where nothing was invalidated are skipped so the bus only carries real
+    updates.
+
+    :param display: The display to drive, e.g. an `adafruit_displayio_sh1107.SH1107`
+    :param float fps: Target number of frames per second
+    """
+
+    def __init__(self, display, fps=10):
+        if fps <= 0:
+            raise ValueError("fps must be greater than 0")
+        self._display = display
+        self._period = 1.0 / fps
+        self._dirty = False
+        display.auto_refresh = False
+        self._deadline = time.monotonic() + self._period
+
+        # Frame statistics
+        self.frames = 0  # frames sent to the display
+        self.skipped_frames = 0  # frame slots where nothing had changed
+        self.missed_deadlines = 0  # frame slots that went by before commit()
+        self.last_frame_time = None  # time.monotonic() when the last frame finished
+        self.last_refresh_duration = 0.0  # seconds the last refresh() took
+
+    @property
+    def display(self):
+        """The display being driven"""
+        return self._display
+
+    @property
+    def fps(self):
+        """Target frames per second"""
+        return 1.0 / self._period
+
+    @fps.setter
+    def fps(self, new_fps):
+        if new_fps <= 0:
+            raise ValueError("fps must be greater than 0")
+        self._period = 1.0 / new_fps
+
+    @property
+    def dirty(self):
+        """`True` if the scene changed since the last committed frame"""
+        return self._dirty
+
+    def show(self, group):
+        """
+        Make ``group`` the scene sent on the next frame. Build a new group
+        while the old one is still showing and swap it in here to change the
+        whole scene at once.
+        """
+        self._display.show(group)
+        self._dirty = True
+
+    def invalidate(self):
+        """Mark the scene as changed so the next frame is sent to the display"""
+        self._dirty = True
+
+    def wait(self):
+        """Sleep until the deadline of the current frame"""
+        delay = self._deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def commit(self, wait=True):
+        """
+        Finish the current frame. Waits for the frame deadline, then refreshes
+        the display once if the scene was invalidated.
+
+        :param bool wait: Set to `False` to commit right away without pacing
+        :return: `True` if a frame was sent to the display
+        :rtype: bool
+        """
+        if wait:
+            self.wait()
+        now = time.monotonic()
+        late = now - self._deadline
+        if late >= self._period:
+            # Whole frame slots went by without a commit, don't try to catch up
+            self.missed_deadlines += int(late / self._period)
+            self._deadline = now
+        self._deadline += self._period
+
+        if not self._dirty:
+            self.skipped_frames += 1
+            return False
+        self._dirty = False
+        self._display.refresh()
+        self.last_frame_time = time.monotonic()
+        self.last_refresh_duration = self.last_frame_time - now
+        self.frames += 1
+        return True
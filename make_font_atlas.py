@@ -0,0 +1,56 @@
+# make_font_atlas - bakes the glyphs of a BDF or PCF font into an atlas file
+#
+# Loaded BDF and PCF fonts give every glyph a bitmap of its own. An atlas keeps
+# the glyphs the application needs in one bitmap of equal cells, like
+# terminalio.FONT, so labels share it. Building one copies every pixel of the
+# glyphs, so run this on the host (with Adafruit Blinka and
+# adafruit-circuitpython-bitmap-font installed) and copy the file to the board:
+#
+#   python make_font_atlas.py fonts/Helvetica-16.bdf helvetica16.atlas "0123456789:. "
+#
+# On the board:
+#
+#   from adafruit_display_text.font_atlas import load_atlas
+#   font = load_atlas("helvetica16.atlas")
+#   text = label.Label(font, text="12:30")
+import sys
+
+from adafruit_bitmap_font import bitmap_font
+
+from adafruit_display_text.font_atlas import build_atlas
+
+# Printable ASCII
+DEFAULT_CHARACTERS = "".join(chr(code_point) for code_point in range(32, 127))
+
+
+def make_font_atlas(font_path, atlas_path, characters=DEFAULT_CHARACTERS):
+    """
+    Write the atlas of ``characters`` in the font at ``font_path`` to
+    ``atlas_path``. Returns the `FontAtlas`.
+    """
+    atlas = build_atlas(bitmap_font.load_font(font_path), characters)
+    atlas.save(atlas_path)
+    return atlas
+
+
+def main(argv):
+    if len(argv) not in (3, 4):
+        print("usage: {} font.bdf out.atlas [characters]".format(argv[0]))
+        return 2
+    atlas = make_font_atlas(*argv[1:])
+    width, height, _, _ = atlas.get_bounding_box()
+    print(
+        "{}: {} glyphs in {}x{} cells, {}x{} bitmap".format(
+            argv[2],
+            atlas.bitmap.width // width,
+            width,
+            height,
+            atlas.bitmap.width,
+            atlas.bitmap.height,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
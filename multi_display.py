@@ -0,0 +1,216 @@
+# multi_display - drives several SH1107 panels sharing one I2C bus
+#
+# Two 128x128 panels at 0x3C and 0x3D refreshed one after the other double the
+# worst case latency of each. MultiDisplay queues the work of every panel and
+# hands the bus out round-robin, one transfer at a time, within a total byte
+# budget so no panel waits for another one's whole frame.
+#
+# Typical use:
+#
+#   panels = MultiDisplay((left, right), bytes_per_second=40000)
+#   panels.show(0, left_group)
+#   panels.write_window(1, 0, 0, 16, 8, clock_digit)
+#   while True:
+#       panels.service()
+import time
+
+# Bytes sent around the data of every page by displays without a
+# page_overhead: the page, upper and lower column commands on a FourWire bus
+_PAGE_OVERHEAD = 3
+
+
+class Panel:
+    """
+    One display managed by `MultiDisplay`, with its frame timing.
+
+    :param display: The display, e.g. an `adafruit_displayio_sh1107.SH1107`
+    """
+
+    def __init__(self, display):
+        self.display = display
+        self.frames = 0  # updates completed on this panel
+        self.last_frame_time = None  # time.monotonic() when the last update completed
+        self.last_latency = 0.0  # seconds from the first queued change to completion
+        self.bytes_sent = 0  # bus bytes spent on this panel
+        self._queue = []
+        self._queued_at = None
+        self._refresh_pending = False
+        self._dirty = None  # (x0, y0, x1, y1) changed since the last refresh
+        # Addressing bytes per page, more on I2C than on FourWire
+        self._page_overhead = getattr(display, "page_overhead", _PAGE_OVERHEAD)
+
+    @property
+    def pending(self):
+        """`True` while there is queued work for this panel"""
+        return bool(self._queue)
+
+    def invalidate(self, area=None):
+        """
+        Queue a refresh of the displayio scene, once.
+
+        :param area: ``(x, y, width, height)`` of the part of the scene that
+            changed, used to estimate the bytes the refresh sends, since
+            displayio only sends the dirty area. `None` for the whole display.
+        """
+        if area is None:
+            area = (0, 0, self.display.width, self.display.height)
+        x, y, width, height = area
+        if self._dirty is None:
+            self._dirty = (x, y, x + width, y + height)
+        else:
+            x0, y0, x1, y1 = self._dirty
+            self._dirty = (
+                min(x0, x),
+                min(y0, y),
+                max(x1, x + width),
+                max(y1, y + height),
+            )
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.enqueue(None)
+
+    def enqueue(self, work):
+        """
+        Queue a ``(page, column, data)`` transfer for ``write_page``, or `None`
+        for a refresh of the displayio scene
+        """
+        if not self._queue:
+            self._queued_at = time.monotonic()
+        self._queue.append(work)
+
+    def _refresh_cost(self):
+        # Estimate: the columns of the dirty area on each page of 8 rows it touches
+        x0, y0, x1, y1 = self._dirty
+        self._dirty = None
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.display.width, x1), min(self.display.height, y1)
+        if x1 <= x0 or y1 <= y0:
+            return 0
+        pages = (y1 + 7) // 8 - y0 // 8
+        return (x1 - x0) * pages + pages * self._page_overhead
+
+    def send_next(self):
+        """Send the oldest queued transfer and return the bytes it cost"""
+        work = self._queue.pop(0)
+        if work is None:  # refresh of the displayio scene
+            self._refresh_pending = False
+            self.display.refresh()
+            cost = self._refresh_cost()
+        else:
+            self.display.write_page(*work)
+            cost = len(work[2]) + self._page_overhead
+        self.bytes_sent += cost
+        if not self._queue:
+            now = time.monotonic()
+            self.frames += 1
+            self.last_frame_time = now
+            self.last_latency = now - self._queued_at
+        return cost
+
+
+class MultiDisplay:
+    """
+    Shares one bus between several displays with interleaved updates.
+
+    Window writes are split into pages and a displayio scene refresh counts as
+    one transfer, as big as the area passed to `invalidate`. Transfers are
+    counted in bus bytes, with the ``page_overhead`` of the display for the
+    addressing of every page. `service` sends at most one transfer per panel
+    per round, moving on to the next panel each time, until the byte budget
+    accumulated since the previous call is spent. A transfer bigger than the
+    remaining budget still goes out and is paid back from the next calls, so
+    large refreshes are delayed but never starved.
+
+    Auto refresh is turned off on all the displays, changes reach the panels
+    only through `service`.
+
+    :param displays: The displays on the bus
+    :param int bytes_per_second: Bus bandwidth to spend on the panels. Around
+        10000 for a 100kHz I2C bus and 40000 for 400kHz.
+    :param int burst: Most bytes that can be saved up while idle. Defaults to
+        a tenth of a second worth of ``bytes_per_second``.
+    """
+
+    def __init__(self, displays, bytes_per_second=10000, burst=None):
+        self._panels = []
+        for display in displays:
+            display.auto_refresh = False
+            self._panels.append(Panel(display))
+        self._rate = bytes_per_second
+        self._burst = burst if burst is not None else bytes_per_second // 10
+        self._credit = 0
+        self._last_service = time.monotonic()
+        self._next = 0
+
+    def __len__(self):
+        return len(self._panels)
+
+    def __getitem__(self, index):
+        return self._panels[index].display
+
+    @property
+    def panels(self):
+        """The `Panel` of each display, holding its frame timing"""
+        return tuple(self._panels)
+
+    @property
+    def pending(self):
+        """`True` while any panel has queued work"""
+        for panel in self._panels:
+            if panel.pending:
+                return True
+        return False
+
+    def show(self, index, group):
+        """Show ``group`` on panel ``index`` and queue a refresh of it"""
+        self._panels[index].display.show(group)
+        self.invalidate(index)
+
+    def invalidate(self, index, area=None):
+        """
+        Queue a refresh of the displayio scene of panel ``index``. ``area`` is
+        the ``(x, y, width, height)`` that changed, see `Panel.invalidate`.
+        """
+        self._panels[index].invalidate(area)
+
+    def write_window(self, index, x, y, width, height, buffer, stride=None):
+        """
+        Queue a direct RAM write to panel ``index``, see
+        `adafruit_displayio_sh1107.SH1107.write_window`. ``buffer`` must not be
+        changed until the panel has no more pending work.
+        """
+        panel = self._panels[index]
+        for work in list(
+            panel.display.window_pages(x, y, width, height, buffer, stride)
+        ):
+            panel.enqueue(work)
+
+    def service(self):
+        """
+        Send queued transfers within the budget available since the last call.
+
+        :return: Number of bytes sent
+        :rtype: int
+        """
+        now = time.monotonic()
+        self._credit = min(
+            self._burst, self._credit + (now - self._last_service) * self._rate
+        )
+        self._last_service = now
+        sent = 0
+        count = len(self._panels)
+        while self._credit > 0:
+            busy = False
+            for _ in range(count):
+                panel = self._panels[self._next]
+                self._next = (self._next + 1) % count
+                if panel.pending:
+                    busy = True
+                    cost = panel.send_next()
+                    self._credit -= cost
+                    sent += cost
+                    if self._credit <= 0:
+                        break
+            if not busy:
+                break
+        return sent
@@ -0,0 +1,183 @@
+# page_bitmap - a 1bpp bitmap stored the way the SH1107 display RAM is laid out
+#
+# displayio.Bitmap stores pixels row by row. The SH1107 driven with
+# pixels_in_byte_share_row=False wants 8 vertically stacked pixels per byte, one
+# page of 8 rows after the other, so every refresh has to transpose the bits.
+# PageBitmap keeps the pixels in that layout to begin with: byte x of page p holds
+# the pixels (x, 8 * p) to (x, 8 * p + 7), least significant bit on top. Sending
+# a frame is then a matter of handing out slices of the buffer.
+
+
+class PageBitmap:
+    """
+    Page packed 1bpp bitmap matching the SH1107 memory layout.
+
+    Pixels are accessed like a `displayio.Bitmap`, with ``bitmap[x, y]`` or a
+    ``y * width + x`` index, and hold 0 or 1. It can't be shown in a displayio
+    `displayio.Group`, it is written to the panel with `write_to`.
+
+    :param int width: Width in pixels, which is the number of bytes per page
+    :param int height: Height in pixels, rounded up to whole pages in memory
+    """
+
+    def __init__(self, width, height):
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be greater than 0")
+        self._width = width
+        self._height = height
+        self._pages = (height + 7) // 8
+        self._buffer = bytearray(width * self._pages)
+
+    @property
+    def width(self):
+        """Width in pixels"""
+        return self._width
+
+    @property
+    def height(self):
+        """Height in pixels"""
+        return self._height
+
+    @property
+    def pages(self):
+        """Number of 8 pixel high pages"""
+        return self._pages
+
+    @property
+    def buffer(self):
+        """The whole page packed buffer, page after page, as a `memoryview`"""
+        return memoryview(self._buffer)
+
+    def page(self, index, x1=0, x2=None):
+        """
+        The bytes of page ``index`` from column ``x1`` up to but excluding
+        ``x2`` as a `memoryview`, ready to be sent to the display.
+        """
+        if x2 is None:
+            x2 = self._width
+        if not 0 <= index < self._pages or not 0 <= x1 <= x2 <= self._width:
+            raise IndexError("page out of range")
+        start = index * self._width
+        return memoryview(self._buffer)[start + x1 : start + x2]
+
+    def _offset(self, key):
+        if isinstance(key, tuple):
+            x, y = key
+        else:
+            y, x = divmod(key, self._width)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise IndexError("pixel out of range")
+        return (y >> 3) * self._width + x, 1 << (y & 7)
+
+    def __getitem__(self, key):
+        offset, bit = self._offset(key)
+        return 1 if self._buffer[offset] & bit else 0
+
+    def __setitem__(self, key, value):
+        offset, bit = self._offset(key)
+        if value:
+            self._buffer[offset] |= bit
+        else:
+            self._buffer[offset] &= ~bit
+
+    def fill(self, value):
+        """Set every pixel to ``value``"""
+        self._buffer[:] = (b"\xff" if value else b"\x00") * len(self._buffer)
+
+    def fill_rect(self, x, y, width, height, value):
+        """
+        Set the pixels of a rectangle to ``value``, clipped to the bitmap.
+        Works a whole page at a time: whole pages get a byte per column and the
+        partial pages at the top and bottom get a single masked operation per
+        column.
+        """
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + width, self._width), min(y + height, self._height)
+        if x1 >= x2 or y1 >= y2:
+            return
+        buffer = self._buffer
+        for page in range(y1 >> 3, ((y2 - 1) >> 3) + 1):
+            top = max(y1 - (page << 3), 0)
+            bottom = min(y2 - (page << 3), 8)
+            mask = ((1 << bottom) - 1) & ~((1 << top) - 1)
+            start = page * self._width
+            if mask == 0xFF:
+                buffer[start + x1 : start + x2] = (b"\xff" if value else b"\x00") * (
+                    x2 - x1
+                )
+            elif value:
+                for i in range(start + x1, start + x2):
+                    buffer[i] |= mask
+            else:
+                mask = ~mask
+                for i in range(start + x1, start + x2):
+                    buffer[i] &= mask
+
+    def blit(
+        self, x, y, source_bitmap, x1=0, y1=0, x2=None, y2=None, skip_index=None
+    ):  # pylint: disable=too-many-arguments,too-many-locals
+        """
+        Copy the ``x1, y1`` to ``x2, y2`` area of ``source_bitmap`` to ``x, y``,
+        clipped to both bitmaps. Pixels equal to ``skip_index`` are not copied.
+
+        A `PageBitmap` source landing on the same row within a page is copied
+        byte by byte, other sources like a `displayio.Bitmap` pixel by pixel.
+        """
+        if x2 is None:
+            x2 = source_bitmap.width
+        if y2 is None:
+            y2 = source_bitmap.height
+        # Clip against the source, then against this bitmap
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, source_bitmap.width), min(y2, source_bitmap.height)
+        if x < 0:
+            x1, x = x1 - x, 0
+        if y < 0:
+            y1, y = y1 - y, 0
+        x2 = min(x2, x1 + self._width - x)
+        y2 = min(y2, y1 + self._height - y)
+        if x1 >= x2 or y1 >= y2:
+            return
+
+        if isinstance(source_bitmap, PageBitmap) and (y & 7) == (y1 & 7):
+            # pylint: disable=protected-access
+            source = source_bitmap._buffer
+            buffer = self._buffer
+            page_shift = (y - y1) >> 3
+            for page in range(y1 >> 3, ((y2 - 1) >> 3) + 1):
+                top = max(y1 - (page << 3), 0)
+                bottom = min(y2 - (page << 3), 8)
+                mask = ((1 << bottom) - 1) & ~((1 << top) - 1)
+                src = page * source_bitmap.width + x1
+                dst = (page + page_shift) * self._width + x
+                for i in range(x2 - x1):
+                    if skip_index is None:
+                        buffer[dst + i] = (buffer[dst + i] & ~mask) | (
+                            source[src + i] & mask
+                        )
+                    elif skip_index == 0:
+                        buffer[dst + i] |= source[src + i] & mask
+                    else:
+                        buffer[dst + i] &= ~(~source[src + i] & mask)
+            return
+
+        for source_y in range(y1, y2):
+            for source_x in range(x1, x2):
+                value = source_bitmap[source_x, source_y]
+                if value != skip_index:
+                    self[x + source_x - x1, y + source_y - y1] = value
+
+    def write_to(self, display, x=0, y=0):
+        """
+        Send the whole bitmap to ``display`` at ``x, y`` with
+        `adafruit_displayio_sh1107.SH1107.write_window`. No per pixel work is
+        done, each page goes out as a slice of the buffer.
+
+        The bitmap is in the panel's native orientation, so the display has to
+        run at its native rotation and ``y`` must be a multiple of 8.
+        """
+        if display.rotation != 0:
+            raise ValueError("Display must run at its native rotation")
+        display.write_window(
+            x, y, self._width, self._pages * 8, self._buffer, stride=self._width
+        )
@@ -0,0 +1,104 @@
+# power_manager - puts an SH1107 to sleep while the scene doesn't change
+#
+# A static logo shown for hours keeps the OLED drive running. PowerManager sits
+# in front of a FrameScheduler, sleeps the panel once no scene change happened
+# for idle_timeout seconds and wakes it again on the next change. The panel keeps
+# its RAM while sleeping, so waking needs no redraw.
+#
+# Typical use:
+#
+#   power = PowerManager(FrameScheduler(display, fps=10), idle_timeout=30)
+#   power.show(group)
+#   while True:
+#       if update_scene(group):
+#           power.invalidate()
+#       power.commit()
+import time
+
+
+class PowerManager:
+    """
+    Sleeps the display after a period without scene changes and wakes it on the
+    next change, recording how long the wake took to reach the panel.
+
+    The wake latency is the time from the change that woke the display until
+    its first frame was sent. Compare it with ``idle_timeout`` to trade power
+    against responsiveness.
+
+    :param scheduler: The `frame_scheduler.FrameScheduler` driving the display.
+        The display must have ``sleep``, ``wake`` and ``is_awake`` like
+        `adafruit_displayio_sh1107.SH1107`.
+    :param float idle_timeout: Seconds without scene changes before sleeping
+    """
+
+    def __init__(self, scheduler, idle_timeout=60):
+        self._scheduler = scheduler
+        self._display = scheduler.display
+        self.idle_timeout = idle_timeout
+        self._last_change = time.monotonic()
+        self._woken_at = None
+
+        # Power statistics
+        self.sleeps = 0  # times the display was put to sleep
+        self.wakes = 0  # times the display was woken up
+        self.last_wake_latency = None  # seconds from wake to first frame
+        self.max_wake_latency = 0.0
+        self._total_wake_latency = 0.0
+        self._measured_wakes = 0
+
+    @property
+    def scheduler(self):
+        """The scheduler committing the frames"""
+        return self._scheduler
+
+    @property
+    def average_wake_latency(self):
+        """Mean seconds from wake to first frame, `None` before the first wake"""
+        if not self._measured_wakes:
+            return None
+        return self._total_wake_latency / self._measured_wakes
+
+    @property
+    def idle_time(self):
+        """Seconds since the last scene change"""
+        return time.monotonic() - self._last_change
+
+    def _changed(self):
+        self._last_change = time.monotonic()
+        if not self._display.is_awake:
+            self._display.wake()
+            self._woken_at = self._last_change
+            self.wakes += 1
+
+    def show(self, group):
+        """Show ``group`` on the next frame, waking the display if needed"""
+        self._changed()
+        self._scheduler.show(group)
+
+    def invalidate(self):
+        """Mark the scene as changed, waking the display if needed"""
+        self._changed()
+        self._scheduler.invalidate()
+
+    def commit(self, wait=True):
+        """
+        Commit the frame through the scheduler, then put the display to sleep
+        if it has been idle for ``idle_timeout`` seconds.
+
+        :param bool wait: Passed on to the scheduler's ``commit``
+        :return: `True` if a frame was sent to the display
+        :rtype: bool
+        """
+        sent = self._scheduler.commit(wait)
+        if sent:
+            if self._woken_at is not None:
+                latency = self._scheduler.last_frame_time - self._woken_at
+                self._woken_at = None
+                self.last_wake_latency = latency
+                self.max_wake_latency = max(self.max_wake_latency, latency)
+                self._total_wake_latency += latency
+                self._measured_wakes += 1
+        elif self._display.is_awake and self.idle_time >= self.idle_timeout:
+            self._display.sleep()
+            self.sleeps += 1
+        return sent
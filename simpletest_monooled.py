@@ -11,14 +11,18 @@ and display offset for the Mono OLED 1.12in display http://adafru.it/5297
 """
 
 
+import time
+
 import board
 import displayio
 import terminalio
 import busio
 
 # can try import bitmap_label below for alternative
-from adafruit_display_text import label
+from adafruit_display_text import label, bitmap_label
+from adafruit_display_text.scrolling_label import ScrollingLabel
 import adafruit_displayio_sh1107
+import asset_rotation
 import bmpinfo as bi
 
 DISPLAY_I2C_ADDRESS = 0x3D
@@ -26,6 +30,7 @@ DISPLAY_I2C_ADDRESS = 0x3D
 WIDTH = 128
 HEIGHT = 128
 BORDER = 2
+ROTATION = 270
 
 
 class screen:
@@ -33,7 +38,16 @@ class screen:
     A series of test screens
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, warm_start=False, pre_rotated=False, **kwargs):
+        """
+        warm_start - set True when the panel was put to sleep by a previous run and
+        kept its image, e.g. adafruit_displayio_sh1107.woke_from_deep_sleep().
+        The full init sequence is skipped and nothing is redrawn until the first
+        screen is shown.
+        pre_rotated - run the panel at its native rotation and rotate the images
+        and text once when a screen is built, instead of having displayio rotate
+        every pixel on every refresh.
+        """
         displayio.release_displays()
         # oled_reset = board.D9
         # Use for default I2C
@@ -45,103 +59,178 @@ class screen:
             display_bus,
             width=WIDTH,
             height=HEIGHT,
-            rotation=270,
+            rotation=adafruit_displayio_sh1107.NATIVE_ROTATION
+            if pre_rotated
+            else ROTATION,
             display_offset=adafruit_displayio_sh1107.DISPLAY_OFFSET_PIMORONI_MONO_OLED_PIM374,
+            warm_start=warm_start,
+            i2c=i2c,
+            i2c_address=DISPLAY_I2C_ADDRESS,
         )
 
         self.color_bitmap = displayio.Bitmap(WIDTH, HEIGHT, 1)
         self.color_palette = displayio.Palette(1)
         self.color_palette[0] = 0xFFFFFF  # White
 
+        # Rotation applied to the assets up front, 0 when displayio does it
+        if pre_rotated:
+            self._asset_rotation = adafruit_displayio_sh1107.panel_rotation(ROTATION)
+        else:
+            self._asset_rotation = 0
+        self._text_palette = displayio.Palette(2)
+        self._text_palette.make_transparent(0)
+        self._text_palette[1] = 0xFFFFFF  # White
+
+    def _show(self, group):
+        """
+        Show group on the display. A warm start turns auto_refresh off so
+        displayio doesn't paint over the image the panel kept, it is turned back
+        on once the first screen replaces that image.
+        """
+        self.display.show(group)
+        if not self.display.auto_refresh:
+            self.display.auto_refresh = True
+
+    def _sprite(self, bitmap, palette, x, y):
+        """
+        TileGrid showing bitmap at x, y, with the bitmap rotated up front when
+        running pre_rotated
+        """
+        if self._asset_rotation:
+            x, y, _, _ = asset_rotation.rotate_rect(
+                x, y, bitmap.width, bitmap.height, self._asset_rotation, WIDTH, HEIGHT
+            )
+            bitmap = asset_rotation.rotate_bitmap(bitmap, self._asset_rotation, 1)
+        return displayio.TileGrid(bitmap, pixel_shader=palette, x=x, y=y)
+
+    def _text(self, text, x, y, scale=1):
+        """
+        White text at x, y. When running pre_rotated the text is rendered once
+        into a bitmap that is rotated up front.
+        """
+        if not self._asset_rotation:
+            return label.Label(
+                terminalio.FONT, text=text, scale=scale, color=0xFFFFFF, x=x, y=y
+            )
+        text_label = bitmap_label.Label(terminalio.FONT, text=text, color=0xFFFFFF)
+        bitmap = text_label.bitmap
+        # The bitmap's top left corner relative to the label origin
+        left, top = text_label.bounding_box[0], text_label.bounding_box[1]
+        x, y, _, _ = asset_rotation.rotate_rect(
+            x + left * scale,
+            y + top * scale,
+            bitmap.width * scale,
+            bitmap.height * scale,
+            self._asset_rotation,
+            WIDTH,
+            HEIGHT,
+        )
+        text_group = displayio.Group(x=x, y=y, scale=scale)
+        text_group.append(
+            displayio.TileGrid(
+                asset_rotation.rotate_bitmap(bitmap, self._asset_rotation),
+                pixel_shader=self._text_palette,
+            )
+        )
+        return text_group
+
     def splash(self):
         # Make the display context
         splash = displayio.Group()
         # self.display.show(splash)
 
-        bg_sprite = displayio.TileGrid(
-            self.color_bitmap, pixel_shader=self.color_palette, x=0, y=0
-        )
+        bg_sprite = self._sprite(self.color_bitmap, self.color_palette, 0, 0)
         splash.append(bg_sprite)
 
         # Draw a smaller inner rectangle in black
         inner_bitmap = displayio.Bitmap(WIDTH - BORDER * 2, HEIGHT - BORDER * 2, 1)
         inner_palette = displayio.Palette(1)
         inner_palette[0] = 0x000000  # Black
-        inner_sprite = displayio.TileGrid(
-            inner_bitmap, pixel_shader=inner_palette, x=BORDER, y=BORDER
-        )
+        inner_sprite = self._sprite(inner_bitmap, inner_palette, BORDER, BORDER)
         splash.append(inner_sprite)
 
         # Draw some white squares
         sm_bitmap = displayio.Bitmap(8, 8, 1)
-        sm_square = displayio.TileGrid(
-            sm_bitmap, pixel_shader=self.color_palette, x=58, y=17
-        )
+        sm_square = self._sprite(sm_bitmap, self.color_palette, 58, 17)
         splash.append(sm_square)
 
         med_bitmap = displayio.Bitmap(16, 16, 1)
-        med_square = displayio.TileGrid(
-            med_bitmap, pixel_shader=self.color_palette, x=71, y=15
-        )
+        med_square = self._sprite(med_bitmap, self.color_palette, 71, 15)
         splash.append(med_square)
 
         lrg_bitmap = displayio.Bitmap(32, 32, 1)
-        lrg_square = displayio.TileGrid(
-            lrg_bitmap, pixel_shader=self.color_palette, x=91, y=28
-        )
+        lrg_square = self._sprite(lrg_bitmap, self.color_palette, 91, 28)
         splash.append(lrg_square)
 
         # Draw some label text
         text1 = "0123456789ABCDEF123456789AB"  # overly long to see where it clips
-        text_area = label.Label(terminalio.FONT, text=text1, color=0xFFFFFF, x=8, y=8)
+        text_area = self._text(text1, 8, 8)
         splash.append(text_area)
         text2 = "SH1107"
-        text_area2 = label.Label(
-            terminalio.FONT, text=text2, scale=2, color=0xFFFFFF, x=9, y=44
-        )
+        text_area2 = self._text(text2, 9, 44, scale=2)
         splash.append(text_area2)
-        self.display.show(splash)
+        self._show(splash)
+
+    def marquee(self, seconds=10):
+        """
+        Scrolls the overly long text of splash() through the border instead of
+        clipping it. The text is rendered once, each step only moves the window.
+        Needs displayio to do the rotation, so not when running pre_rotated.
+        """
+        if self._asset_rotation:
+            raise RuntimeError("marquee() can't run pre_rotated")
+        screen = displayio.Group()
+        text1 = "0123456789ABCDEF123456789AB"
+        ticker = ScrollingLabel(
+            terminalio.FONT, WIDTH - 16, text=text1, color=0xFFFFFF, x=8, y=8
+        )
+        screen.append(ticker)
+        self._show(screen)
+
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            ticker.scroll()
+            time.sleep(0.05)
 
     def origin(self):
         screen = displayio.Group()
-        self.display.show(screen)
+        self._show(screen)
 
         tiny_bitmap = displayio.Bitmap(2, 2, 1)
-        tiny_square = displayio.TileGrid(
-            tiny_bitmap, pixel_shader=self.color_palette, x=0, y=0
-        )
+        tiny_square = self._sprite(tiny_bitmap, self.color_palette, 0, 0)
         screen.append(tiny_square)
 
     def triangle(self):
         screen = displayio.Group()
-        self.display.show(screen)
+        self._show(screen)
 
         logo_bitmap = displayio.Bitmap(8, 8, 1)
         # logo_shape = displayio.Shape(8, 8, [0x01, 0x03, 0x07, 0x15, 0x31, 0x63, 0x127, 0x255])
         for i in range(0, 8):
             for j in range(i, 8):
                 logo_bitmap[i, j] = 1
-        logo = displayio.TileGrid(
-            logo_bitmap, pixel_shader=self.color_palette, x=0, y=0
-        )
+        logo = self._sprite(logo_bitmap, self.color_palette, 0, 0)
         screen.append(logo)
 
     def drew_logo(self):
         screen = displayio.Group()
-        self.display.show(screen)
+        self._show(screen)
 
         with open("drew_logo_mr_ayers.bmp", "rb") as bitmap_file:
             info = bi.bmpinfo(bitmap_file)
+            # The bmp is read straight into the rotated bitmap
+            logo_bitmap = info.bitmap(rotation=self._asset_rotation)
+            x, y, _, _ = asset_rotation.rotate_rect(
+                0, 0, info.width, abs(info.height), self._asset_rotation, WIDTH, HEIGHT
+            )
             logo = displayio.TileGrid(
-                info.bitmap(), pixel_shader=self.color_palette, x=0, y=0
+                logo_bitmap, pixel_shader=self.color_palette, x=x, y=y
             )
             screen.append(logo)
 
     def hello(self):
         screen = displayio.Group()
         text = "Hello!"
-        text_area = label.Label(
-            terminalio.FONT, text=text, scale=3, color=0xFFFFFF, x=18, y=60
-        )
+        text_area = self._text(text, 18, 60, scale=3)
         screen.append(text_area)
-        self.display.show(screen)
+        self._show(screen)
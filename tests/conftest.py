@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+"""
+Host side stand-ins for the CircuitPython modules the drivers import, so the
+bytes the drivers put on the bus can be checked with pytest on a computer.
+"""
+
+import os
+import sys
+import types
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class Wire:
+    """Every I2C transaction that reaches the bus, as (address, bytes)"""
+
+    def __init__(self):
+        self.transactions = []
+
+
+class FakeI2C:
+    """busio.I2C recording writes on a `Wire`"""
+
+    def __init__(self, wire):
+        self.wire = wire
+        self.locked = False
+
+    def try_lock(self):
+        if self.locked:
+            return False
+        self.locked = True
+        return True
+
+    def unlock(self):
+        self.locked = False
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        assert self.locked, "writeto without holding the lock"
+        if end is None:
+            end = len(buffer)
+        self.wire.transactions.append((address, bytes(buffer[start:end])))
+
+
+class I2CDisplay:
+    """displayio.I2CDisplay framing: send() puts out every byte as a command"""
+
+    def __init__(self, i2c, *, device_address):
+        self.i2c = i2c
+        self.device_address = device_address
+
+    def send(self, command, data):
+        for byte in bytes([command]) + bytes(data):
+            self.i2c.wire.transactions.append(
+                (self.device_address, bytes([0x80, byte]))
+            )
+
+
+class FourWire:
+    """displayio.FourWire recording (is_data, bytes) as the D/C line selects"""
+
+    def __init__(self):
+        self.transfers = []
+
+    def send(self, command, data):
+        self.transfers.append((False, bytes([command])))
+        if len(data):
+            self.transfers.append((True, bytes(data)))
+
+
+class Display:
+    """displayio.Display keeping the arguments the drivers read back"""
+
+    def __init__(self, bus, init_sequence, **kwargs):
+        self.bus = bus
+        self.init_sequence = init_sequence
+        self.width = kwargs["width"]
+        self.height = kwargs["height"]
+        self.rotation = kwargs.get("rotation", 0)
+        self.auto_refresh = kwargs.get("auto_refresh", True)
+        self.refreshes = 0
+
+    def refresh(self, **kwargs):
+        self.refreshes += 1
+        return True
+
+    def show(self, group):
+        pass
+
+
+class Group(list):
+    """displayio.Group as a list of layers"""
+
+    def __init__(self, *, scale=1, x=0, y=0):
+        super().__init__()
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+
+
+class Palette(list):
+    """displayio.Palette of ``color_count`` colors"""
+
+    def __init__(self, color_count):
+        super().__init__([0] * color_count)
+
+    def make_transparent(self, index):
+        pass
+
+
+displayio = types.ModuleType("displayio")
+displayio.Group = Group
+displayio.Palette = Palette
+displayio.Display = Display
+displayio.I2CDisplay = I2CDisplay
+displayio.FourWire = FourWire
+sys.modules["displayio"] = displayio
+
+micropython = types.ModuleType("micropython")
+micropython.const = lambda value: value
+sys.modules["micropython"] = micropython
+
+# Only named in type annotations, classes of their own are enough
+fontio = types.ModuleType("fontio")
+fontio.BuiltinFont = type("BuiltinFont", (), {})
+fontio.Glyph = namedtuple(
+    "Glyph", "bitmap tile_index width height dx dy shift_x shift_y"
+)
+sys.modules["fontio"] = fontio
+for name, font_class in (("bdf", "BDF"), ("pcf", "PCF")):
+    module = types.ModuleType("adafruit_bitmap_font." + name)
+    setattr(module, font_class, type(font_class, (), {}))
+    sys.modules[module.__name__] = module
+sys.modules["adafruit_bitmap_font"] = types.ModuleType("adafruit_bitmap_font")
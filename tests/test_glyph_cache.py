@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+"""
+A glyph budget must bound the glyphs a BDF or PCF font holds loaded, however
+many different glyphs the text has.
+"""
+
+from fontio import Glyph
+
+from adafruit_display_text import (
+    GlyphCache,
+    glyph_cache,
+    iter_wrap_text_to_pixels,
+    wrap_text_to_pixels,
+)
+
+WIDTH = 8
+HEIGHT = 12
+GLYPH_SIZE = 4 * HEIGHT  # rows padded to 32 bits
+BUDGET = 16 * GLYPH_SIZE
+# Many different non ASCII glyphs between the spaces
+TEXT = " ".join(
+    "".join(chr(0x4E00 + word * 7 + index) for index in range(7)) for word in range(80)
+)
+
+
+class LazyFont:
+    """Loads glyphs on demand like adafruit_bitmap_font's BDF and PCF fonts,
+    recording the most glyphs it ever held at once"""
+
+    def __init__(self):
+        self._glyphs = {}
+        self.peak = 0
+        self.load_calls = 0
+
+    def get_bounding_box(self):
+        return WIDTH, HEIGHT, 0, -2
+
+    def load_glyphs(self, code_points):
+        if isinstance(code_points, int):
+            code_points = (code_points,)
+        else:
+            self.load_calls += 1  # a batch, not the lazy load of get_glyph
+        for code_point in code_points:
+            if code_point not in self._glyphs:
+                self._glyphs[code_point] = Glyph(
+                    None, 0, WIDTH, HEIGHT, 0, -2, WIDTH, 0
+                )
+        self.peak = max(self.peak, len(self._glyphs))
+
+    def get_glyph(self, code_point):
+        self.load_glyphs(code_point)
+        return self._glyphs.get(code_point)
+
+
+def resident_limit(cache):
+    # The glyphs the budget allows, plus the ASCII glyphs that are never evicted
+    return BUDGET // GLYPH_SIZE + sum(1 for glyph in cache._ascii if glyph)
+
+
+def test_load_glyphs_stays_within_the_budget():
+    font = LazyFont()
+    cache = GlyphCache(font, budget=BUDGET)
+    cache.load_glyphs(TEXT)
+    assert font.peak <= resident_limit(cache)
+    assert cache.used <= BUDGET
+    # Batches of a whole budget, not one load per glyph
+    assert font.load_calls <= len(set(TEXT)) // (BUDGET // GLYPH_SIZE) + 2
+
+
+def test_load_glyphs_stays_within_max_glyphs():
+    font = LazyFont()
+    cache = GlyphCache(font, max_glyphs=10, budget=BUDGET)
+    cache.load_glyphs(TEXT)
+    assert font.peak <= 10 + sum(1 for glyph in cache._ascii if glyph)
+
+
+def test_wrap_text_to_pixels_stays_within_the_budget():
+    font = LazyFont()
+    cache = glyph_cache(font)
+    cache.budget = BUDGET
+    lines = wrap_text_to_pixels(TEXT, 128, font)
+    assert font.peak <= resident_limit(cache)
+    assert lines == list(iter_wrap_text_to_pixels(iter(TEXT), 128, font))
+    assert "".join(lines).replace(" ", "") == TEXT.replace(" ", "")
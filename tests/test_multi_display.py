@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+"""
+MultiDisplay budgets bus bytes, so the addressing of every page has to be
+counted the way the bus of the panel sends it.
+"""
+
+from conftest import FakeI2C, FourWire, I2CDisplay, Wire
+
+from adafruit_displayio_sh1107 import SH1107, NATIVE_ROTATION
+from multi_display import MultiDisplay
+
+ADDRESS = 0x3C
+
+
+def i2c_display(wire):
+    i2c = FakeI2C(wire)
+    bus = I2CDisplay(i2c, device_address=ADDRESS)
+    return SH1107(
+        bus,
+        width=128,
+        height=128,
+        rotation=NATIVE_ROTATION,
+        i2c=i2c,
+        i2c_address=ADDRESS,
+    )
+
+
+def four_wire_display():
+    return SH1107(FourWire(), width=128, height=128, rotation=NATIVE_ROTATION)
+
+
+def test_page_write_cost_is_the_bytes_on_the_i2c_bus():
+    wire = Wire()
+    display = i2c_display(wire)
+    wire.transactions.clear()
+    panels = MultiDisplay((display,), bytes_per_second=1000000, burst=1000000)
+    panels.write_window(0, 0, 0, 16, 8, bytes(16))
+    panel = panels.panels[0]
+    cost = panel.send_next()
+    # The address byte of each transaction isn't part of the transactions
+    assert cost == sum(1 + len(data) for _, data in wire.transactions)
+    assert cost == 16 + display.page_overhead
+
+
+def test_page_write_cost_on_four_wire():
+    display = four_wire_display()
+    panels = MultiDisplay((display,), bytes_per_second=1000000, burst=1000000)
+    panels.write_window(0, 0, 0, 16, 8, bytes(16))
+    assert panels.panels[0].send_next() == 16 + 3
+
+
+def test_refresh_cost_counts_the_pages_of_the_dirty_area():
+    i2c_panels = MultiDisplay((i2c_display(Wire()),))
+    four_wire_panels = MultiDisplay((four_wire_display(),))
+    for panels in (i2c_panels, four_wire_panels):
+        panels.invalidate(0, (10, 4, 20, 8))  # rows 4 to 11, two pages
+    assert i2c_panels.panels[0].send_next() == 2 * 20 + 2 * (3 * 3 + 2)
+    assert four_wire_panels.panels[0].send_next() == 2 * 20 + 2 * 3
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2022 Eric Ayers
+#
+# SPDX-License-Identifier: MIT
+"""
+Direct display RAM writes must reach the panel as data. On I2C the SH1107 reads
+a 0x80 control byte as "one command follows" and 0x40 as "display RAM data
+follows", so pixel bytes framed with 0x80 would run as commands (0xAE display
+off, 0xA7 invert, ...).
+"""
+
+import pytest
+
+from conftest import FakeI2C, FourWire, I2CDisplay, Wire
+
+from adafruit_displayio_sh1107 import SH1107, NATIVE_ROTATION
+from multi_display import MultiDisplay
+from page_bitmap import PageBitmap
+
+ADDRESS = 0x3D
+# Pixel bytes that would wreck the panel state if sent as commands
+PIXELS = bytes([0xAE, 0xA7, 0xB3, 0x00, 0xFF, 0x81])
+
+
+def i2c_display(wire, with_i2c=True):
+    i2c = FakeI2C(wire)
+    bus = I2CDisplay(i2c, device_address=ADDRESS)
+    kwargs = {"i2c": i2c, "i2c_address": ADDRESS} if with_i2c else {}
+    display = SH1107(bus, width=128, height=128, rotation=NATIVE_ROTATION, **kwargs)
+    wire.transactions.clear()  # forget about construction
+    return display
+
+
+def check_page_write(transactions, page, column, data):
+    """The three addressing commands, then the data in a single 0x40 transaction"""
+    assert transactions == [
+        (ADDRESS, bytes([0x80, 0xB0 | page])),
+        (ADDRESS, bytes([0x80, 0x10 | (column >> 4)])),
+        (ADDRESS, bytes([0x80, column & 0x0F])),
+        (ADDRESS, b"\x40" + bytes(data)),
+    ]
+
+
+def test_write_page_sends_pixels_as_data_on_i2c():
+    wire = Wire()
+    display = i2c_display(wire)
+    display.write_page(3, 0x25, PIXELS)
+    check_page_write(wire.transactions, 3, 0x25, PIXELS)
+    assert not display.bus.i2c.locked
+
+
+def test_write_page_without_i2c_is_refused_on_i2c():
+    wire = Wire()
+    display = i2c_display(wire, with_i2c=False)
+    with pytest.raises(RuntimeError):
+        display.write_page(0, 0, PIXELS)
+    assert not wire.transactions
+
+
+def test_write_page_sends_pixels_as_data_on_four_wire():
+    bus = FourWire()
+    display = SH1107(bus, width=128, height=128, rotation=NATIVE_ROTATION)
+    bus.transfers.clear()
+    display.write_page(1, 0x12, PIXELS)
+    assert bus.transfers == [
+        (False, b"\xb1"),
+        (False, b"\x11"),
+        (False, b"\x02"),
+        (True, PIXELS),
+    ]
+
+
+def test_write_window_pages_on_i2c():
+    wire = Wire()
+    display = i2c_display(wire)
+    buffer = bytes(range(0xA0, 0xA0 + 16))  # two pages of eight columns
+    display.write_window(8, 16, 8, 16, buffer)
+    check_page_write(wire.transactions[:4], 2, 8, buffer[:8])
+    check_page_write(wire.transactions[4:], 3, 8, buffer[8:])
+
+
+def test_page_bitmap_write_to_on_i2c():
+    wire = Wire()
+    display = i2c_display(wire)
+    bitmap = PageBitmap(4, 8)
+    bitmap.fill_rect(0, 0, 4, 8, 1)
+    bitmap[1, 0] = 0
+    bitmap.write_to(display, 8, 0)
+    check_page_write(wire.transactions, 0, 8, [0xFF, 0xFE, 0xFF, 0xFF])
+
+
+def test_multi_display_write_window_on_i2c():
+    wire = Wire()
+    display = i2c_display(wire)
+    panels = MultiDisplay((display,), bytes_per_second=1000000, burst=1000000)
+    panels.write_window(0, 0, 8, 4, 8, PIXELS[:4])
+    panels._credit = 1000000  # pylint: disable=protected-access
+    panels.service()
+    check_page_write(wire.transactions, 1, 0, PIXELS[:4])
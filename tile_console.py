@@ -0,0 +1,247 @@
+# tile_console - a full screen character grid drawn with the tiles of the font
+#
+# One label.Label per line builds new TileGrids whenever a line changes. The
+# console is a single displayio.TileGrid over the bitmap of a fixed width font such
+# as terminalio.FONT, one tile per character cell. A shadow copy of the tile
+# indices makes every write, scroll and cursor move touch only the cells that
+# change, and no glyph is ever rendered: scrolling moves tile indices up.
+#
+# Typical use:
+#
+#   console = TileConsole(terminalio.FONT, 128, 128)
+#   display.show(console)
+#   console.write("temp {:.1f}\n".format(temperature))
+#   console.write_at(0, console.rows - 1, "battery ok")
+import displayio
+
+from adafruit_display_text import glyph_cache
+
+
+class TileConsole(displayio.Group):
+    """
+    Grid of ``columns`` x ``rows`` character cells that text is written to like a
+    terminal. Text written past the last column continues on the next row, text
+    written past the last row scrolls the grid up.
+
+    :param font: A fixed width font with all its glyphs in one ``bitmap``, like
+        ``terminalio.FONT``
+    :param int width: Width of the area to fill in pixels, 128 for the SH1107
+    :param int height: Height of the area to fill in pixels
+    :param int columns: Number of columns, by default as many as fit in ``width``
+    :param int rows: Number of rows, by default as many as fit in ``height``
+    :param int color: Color of the text
+    :param int background_color: Color of the cells, `None` for transparent
+    :param bool show_cursor: Show an underscore on the cell the next character
+        is written to
+    """
+
+    def __init__(
+        self,
+        font,
+        width=128,
+        height=128,
+        columns=None,
+        rows=None,
+        color=0xFFFFFF,
+        background_color=0x000000,
+        show_cursor=False,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        cell = glyph_cache(font).monospace
+        if cell is None or cell.width != cell.shift_x:
+            raise ValueError(
+                "TileConsole needs a fixed width font like terminalio.FONT"
+            )
+        self._font = font
+        self._cell_width = cell.width
+        self._cell_height = cell.height
+        self._columns = columns if columns is not None else width // cell.width
+        self._rows = rows if rows is not None else height // cell.height
+        if self._columns <= 0 or self._rows <= 0:
+            raise ValueError("The console needs at least one cell")
+
+        self._tile_indices = {}
+        self._blank = self._tile(" ")
+
+        palette = displayio.Palette(2)
+        if background_color is None:
+            palette.make_transparent(0)
+        else:
+            palette[0] = background_color
+        palette[1] = color
+        self._palette = palette
+        self._grid = displayio.TileGrid(
+            cell.bitmap,
+            pixel_shader=palette,
+            width=self._columns,
+            height=self._rows,
+            tile_width=cell.width,
+            tile_height=cell.height,
+            default_tile=self._blank,
+        )
+        self.append(self._grid)
+        # Tile index of every cell as last written to the grid
+        self._lines = [[self._blank] * self._columns for _ in range(self._rows)]
+
+        # The cursor is a one tile grid drawn over the cell, moving it is O(1)
+        cursor_palette = displayio.Palette(2)
+        cursor_palette.make_transparent(0)
+        cursor_palette[1] = color
+        self._cursor_grid = displayio.TileGrid(
+            cell.bitmap,
+            pixel_shader=cursor_palette,
+            width=1,
+            height=1,
+            tile_width=cell.width,
+            tile_height=cell.height,
+            default_tile=self._tile("_"),
+        )
+        self._cursor_grid.hidden = not show_cursor
+        self.append(self._cursor_grid)
+        self._column = 0
+        self._row = 0
+
+    @property
+    def columns(self):
+        """Number of character cells per row"""
+        return self._columns
+
+    @property
+    def rows(self):
+        """Number of rows of character cells"""
+        return self._rows
+
+    @property
+    def cursor(self):
+        """``(column, row)`` of the cell the next character is written to"""
+        return min(self._column, self._columns - 1), self._row
+
+    @cursor.setter
+    def cursor(self, position):
+        column, row = position
+        if not (0 <= column < self._columns and 0 <= row < self._rows):
+            raise ValueError("cursor must be a cell of the console")
+        self._move_cursor(column, row)
+
+    @property
+    def show_cursor(self):
+        """`True` when the cursor is shown"""
+        return not self._cursor_grid.hidden
+
+    @show_cursor.setter
+    def show_cursor(self, show):
+        self._cursor_grid.hidden = not show
+
+    @property
+    def color(self):
+        """Color of the text"""
+        return self._palette[1]
+
+    @color.setter
+    def color(self, new_color):
+        self._palette[1] = new_color
+        self._cursor_grid.pixel_shader[1] = new_color
+
+    def _tile(self, char):
+        # Tile index of the glyph of char, a blank for characters the font lacks
+        tile = self._tile_indices.get(char)
+        if tile is None:
+            glyph = glyph_cache(self._font).get_glyph(ord(char))
+            if glyph is None:
+                tile = self._tile_indices.get(" ", 0)
+            else:
+                tile = glyph.tile_index
+            self._tile_indices[char] = tile
+        return tile
+
+    def _set_cell(self, column, row, tile):
+        line = self._lines[row]
+        if line[column] != tile:
+            line[column] = tile
+            self._grid[column, row] = tile
+
+    def _move_cursor(self, column, row):
+        self._column = column
+        self._row = row
+        self._cursor_grid.x = column * self._cell_width
+        self._cursor_grid.y = row * self._cell_height
+
+    def write(self, text):
+        """
+        Write ``text`` at the cursor and move the cursor after it. ``\\n`` starts
+        a new row and ``\\r`` returns to the first column of the row.
+
+        :param str text: The text to write
+        """
+        column, row = self._column, self._row
+        for char in text:
+            if char == "\r":
+                column = 0
+                continue
+            if char == "\n" or column == self._columns:
+                column = 0
+                row += 1
+            if row == self._rows:
+                self.scroll()
+                row -= 1
+            if char != "\n":
+                self._set_cell(column, row, self._tile(char))
+                column += 1
+        # The cursor stays on the last column until the next character
+        self._move_cursor(min(column, self._columns - 1), row)
+        self._column = column
+
+    def write_at(self, column, row, text):
+        """
+        Write ``text`` on ``row`` from ``column`` on, without moving the cursor.
+        Text past the last column is cut off.
+
+        :param int column: Column of the first character
+        :param int row: Row to write to
+        :param str text: The text to write, without line breaks
+        """
+        if not 0 <= row < self._rows:
+            raise ValueError("row must be a row of the console")
+        for char in text[: max(0, self._columns - column)]:
+            if column >= 0:
+                self._set_cell(column, row, self._tile(char))
+            column += 1
+
+    def clear_line(self, row):
+        """
+        Blank all the cells of ``row``.
+
+        :param int row: The row to clear
+        """
+        blank = self._blank
+        for column in range(self._columns):
+            self._set_cell(column, row, blank)
+
+    def clear(self):
+        """Blank every cell and move the cursor to the top left cell."""
+        for row in range(self._rows):
+            self.clear_line(row)
+        self._move_cursor(0, 0)
+
+    def scroll(self, lines=1):
+        """
+        Move the content of the console ``lines`` rows up. The rows at the
+        bottom become blank. Only the cells whose tile differs from the one of
+        the row below are written, the glyphs aren't drawn again.
+
+        :param int lines: Number of rows to scroll
+        """
+        if lines <= 0:
+            return
+        old = self._lines
+        blank_line = [self._blank] * self._columns
+        grid = self._grid
+        for row in range(self._rows):
+            source = old[row + lines] if row + lines < self._rows else blank_line
+            target = old[row]
+            for column in range(self._columns):
+                if target[column] != source[column]:
+                    grid[column, row] = source[column]
+        kept = old[lines:]
+        self._lines = kept + [list(blank_line) for _ in range(self._rows - len(kept))]